@@ -14,19 +14,39 @@ All calculations require latitude, longitude, and date.
 All times are returned in the local timezone (auto-detected from coordinates).
 """
 
-from datetime import datetime, timedelta, timezone
+import math
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+import numpy as np
 from skyfield import almanac
 from skyfield.api import load, wgs84
 from skyfield.timelib import Time
-from timezonefinder import TimezoneFinder
+
+from .timezones import timezone_name_at
+
+
+# Moon phase names in order of phase angle
+_PHASE_NAMES = (
+    "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+    "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent",
+)
+
+# Phase name per 10° bin centred on multiples of 10° (bin i covers [10i - 5, 10i + 5)),
+# so the principal phases get ±5° bands and the intermediate phases the 80° between them
+_PHASE_NAME_BINS = tuple(
+    _PHASE_NAMES[2 * (i // 9)] if i % 9 == 0 else _PHASE_NAMES[2 * (i // 9) + 1]
+    for i in range(36)
+)
 
 
 class AstronomyService:
     """Service for calculating astronomical events for a given location."""
 
+    # Max cached get_sun_events results, evicted oldest-first
+    SUN_EVENTS_CACHE_SIZE = 4096
+
     def __init__(self):
         """Initialize the astronomy service with required data."""
         # Load the ephemeris data
@@ -38,13 +58,13 @@ class AstronomyService:
         self.earth = self.eph["earth"]
         self.moon = self.eph["moon"]
 
-        # Timezone finder for auto-detection
-        self._tf = TimezoneFinder()
+        # Sun events keyed by (lat, lon, date, days, timezone_str); see get_sun_events
+        self._sun_events_cache = {}
 
     def _get_timezone(self, lat: float, lon: float, timezone_str: Optional[str] = None) -> ZoneInfo:
         """Get timezone for coordinates, auto-detecting if not provided."""
         if timezone_str is None:
-            timezone_str = self._tf.timezone_at(lat=lat, lng=lon)
+            timezone_str = timezone_name_at(lat, lon)
             if timezone_str is None:
                 timezone_str = 'UTC'
 
@@ -53,26 +73,49 @@ class AstronomyService:
         except (ValueError, KeyError):
             return ZoneInfo('UTC')
 
-    def _get_time_range(self, date: datetime, days: int = 1) -> Tuple[Time, Time]:
+    def _get_day_range(self, date: datetime, days: int, tz: ZoneInfo) -> Tuple[List[datetime], np.ndarray]:
         """
-        Get a time range for the specified date and number of days.
+        Get the local midnights bounding each day of the range.
+
+        Days are calendar days in the location's timezone, so each one holds that
+        day's dawn, sunrise, sunset and dusk in order.
 
         Args:
-            date: The starting date
+            date: The starting date (its year, month and day are used)
             days: Number of days to include
+            tz: Timezone of the location
 
         Returns:
-            Tuple of (start_time, end_time) as Skyfield Time objects
+            Tuple of (local midnight of each day, TT Julian dates of the days + 1
+            midnights bounding them)
+        """
+        first_day = date.date()
+        midnights = [
+            datetime.combine(first_day + timedelta(days=offset), datetime.min.time(), tzinfo=tz)
+            for offset in range(days + 1)
+        ]
+        return midnights[:-1], self.ts.from_datetimes(midnights).tt
+
+    def _group_by_day(self, times: Time, events, boundaries_tt: np.ndarray) -> List[List[Tuple[Time, Any]]]:
         """
-        # Set to midnight UTC for the start date
-        start_date = datetime(date.year, date.month, date.day, tzinfo=timezone.utc)
-        end_date = start_date + timedelta(days=days)
+        Split events found over a whole range into per-day lists.
 
-        # Convert to Skyfield time objects
-        t0 = self.ts.from_datetime(start_date)
-        t1 = self.ts.from_datetime(end_date)
+        Args:
+            times: Event times returned by find_discrete
+            events: Event values returned by find_discrete
+            boundaries_tt: TT Julian dates of the day boundaries (see _get_day_range)
 
-        return t0, t1
+        Returns:
+            One list of (time, event) pairs per day, in time order
+        """
+        grouped = [[] for _ in range(len(boundaries_tt) - 1)]
+        if len(events) == 0:
+            return grouped
+        day_index = np.searchsorted(boundaries_tt, times.tt, side="right") - 1
+        for i, (day, event) in enumerate(zip(day_index.tolist(), events)):
+            if 0 <= day < len(grouped):
+                grouped[day].append((times[i], event))
+        return grouped
 
     def _get_degrees_function(self, location, angle_degrees):
         """
@@ -125,42 +168,51 @@ class AstronomyService:
         Returns:
             List of dictionaries containing sun events for each day
         """
-        t0, t1 = self._get_time_range(date, days)
+        # Results depend only on the calendar date of `date` (see _get_day_range);
+        # cache them so repeated requests for a spot skip the Skyfield root finding
+        key = (lat, lon, date.date(), days, timezone_str)
+        cached = self._sun_events_cache.get(key)
+        if cached is None:
+            cached = self._compute_sun_events(lat, lon, date, days, timezone_str)
+
+            # Evict the oldest entry so arbitrary coordinates can't grow the cache without bound
+            if len(self._sun_events_cache) >= self.SUN_EVENTS_CACHE_SIZE:
+                self._sun_events_cache.pop(next(iter(self._sun_events_cache)))
+            self._sun_events_cache[key] = cached
+
+        # Copy the per-day dicts so callers can't modify the cached result
+        return [dict(day) for day in cached]
+
+    def _compute_sun_events(
+        self, lat: float, lon: float, date: datetime, days: int,
+        timezone_str: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Calculate sun events for the given location and date range (uncached)."""
         tz = self._get_timezone(lat, lon, timezone_str)
 
         # Create location object
         location = wgs84.latlon(lat, lon)
 
-        # Define event types
-        sun_events = []
-
-        # Loop through each day in the range
-        for day_offset in range(days):
-            day_date = date + timedelta(days=day_offset)
-
-            # Set midnight for this day
-            day_start = datetime(
-                day_date.year, day_date.month, day_date.day, tzinfo=timezone.utc
-            )
-            day_end = day_start + timedelta(days=1)
+        day_starts, boundaries_tt = self._get_day_range(date, days, tz)
+        t0, t1 = self.ts.tt_jd(boundaries_tt[0]), self.ts.tt_jd(boundaries_tt[-1])
 
-            # Convert to Skyfield time objects
-            day_t0 = self.ts.from_datetime(day_start)
-            day_t1 = self.ts.from_datetime(day_end)
+        # Search the whole range once per event type and split the results by day,
+        # rather than running a separate search for every day
+        f = almanac.sunrise_sunset(self.eph, location)
+        times, events = almanac.find_discrete(t0, t1, f)
+        sun_by_day = self._group_by_day(times, events, boundaries_tt)
 
-            # Get sunrise and sunset
-            f = almanac.sunrise_sunset(self.eph, location)
-            times, events = almanac.find_discrete(day_t0, day_t1, f)
+        # Get civil dawn and dusk (sun 6° below horizon)
+        # Define a function that returns True when the sun is above -6°
+        civil_twilight_func = self._get_degrees_function(location, -6.0)
 
-            # Get civil dawn and dusk (sun 6° below horizon)
-            # Define a function that returns True when the sun is above -6°
-            civil_twilight_func = self._get_degrees_function(location, -6.0)
+        # Find times when this function changes value
+        civil_times, civil_events = almanac.find_discrete(t0, t1, civil_twilight_func)
+        civil_by_day = self._group_by_day(civil_times, civil_events, boundaries_tt)
 
-            # Find times when this function changes value
-            civil_times, civil_events = almanac.find_discrete(
-                day_t0, day_t1, civil_twilight_func
-            )
+        sun_events = []
 
+        for day_start, day_sun, day_civil in zip(day_starts, sun_by_day, civil_by_day):
             # Prepare events for this day
             day_result = {
                 "date": day_start.strftime("%Y-%m-%d"),
@@ -172,7 +224,7 @@ class AstronomyService:
             }
 
             # Process sunrise/sunset
-            for time, event in zip(times, events):
+            for time, event in day_sun:
                 if event == 1:  # Sunrise
                     day_result["sunrise"] = self._format_time(time, tz)
                 else:  # Sunset
@@ -182,7 +234,7 @@ class AstronomyService:
             dawn_found = False
             dusk_found = False
 
-            for time, event in zip(civil_times, civil_events):
+            for time, event in day_civil:
                 if event and not dawn_found:  # Civil dawn (night to day)
                     day_result["civil_dawn"] = self._format_time(time, tz)
                     dawn_found = True
@@ -219,40 +271,31 @@ class AstronomyService:
         Returns:
             List of dictionaries containing moon events for each day
         """
-        t0, t1 = self._get_time_range(date, days)
         tz = self._get_timezone(lat, lon, timezone_str)
 
         # Create location object
         location = wgs84.latlon(lat, lon)
 
-        moon_events = []
-
-        # Loop through each day in the range
-        for day_offset in range(days):
-            day_date = date + timedelta(days=day_offset)
-
-            # Set midnight for this day
-            day_start = datetime(
-                day_date.year, day_date.month, day_date.day, tzinfo=timezone.utc
-            )
-            day_end = day_start + timedelta(days=1)
+        day_starts, boundaries_tt = self._get_day_range(date, days, tz)
+        t0, t1 = self.ts.tt_jd(boundaries_tt[0]), self.ts.tt_jd(boundaries_tt[-1])
 
-            # Convert to Skyfield time objects
-            day_t0 = self.ts.from_datetime(day_start)
-            day_t1 = self.ts.from_datetime(day_end)
+        # Get moon rise and set over the whole range, split by day
+        f_moon = almanac.risings_and_settings(self.eph, self.moon, location)
+        moon_times, moon_events_list = almanac.find_discrete(t0, t1, f_moon)
+        moon_by_day = self._group_by_day(moon_times, moon_events_list, boundaries_tt)
 
-            # Get moon rise and set
-            f_moon = almanac.risings_and_settings(self.eph, self.moon, location)
-            moon_times, moon_events_list = almanac.find_discrete(day_t0, day_t1, f_moon)
+        # Calculate moon phase at each day's local midnight in one call
+        phase_values = almanac.moon_phase(self.eph, self.ts.tt_jd(boundaries_tt[:-1])).degrees
 
-            # Calculate moon phase for midnight
-            midnight_time = self.ts.from_datetime(day_start)
-            moon_phase_value = almanac.moon_phase(self.eph, midnight_time).degrees
-            phase_name = self._get_moon_phase_name(moon_phase_value)
+        # Calculate phase names and illumination for all days at once
+        phase_names = self._get_moon_phase_names(phase_values)
+        illuminations = self._get_moon_illuminations(phase_values).tolist()
 
-            # Calculate illumination
-            phase_percent = self._get_moon_illumination(moon_phase_value)
+        moon_events = []
 
+        for day_start, day_moon, moon_phase_value, phase_name, phase_percent in zip(
+            day_starts, moon_by_day, phase_values.tolist(), phase_names, illuminations
+        ):
             # Prepare events for this day
             day_result = {
                 "date": day_start.strftime("%Y-%m-%d"),
@@ -264,7 +307,7 @@ class AstronomyService:
             }
 
             # Process moonrise/moonset
-            for time, event in zip(moon_times, moon_events_list):
+            for time, event in day_moon:
                 if event == 1:  # Moonrise
                     day_result["moonrise"] = self._format_time(time, tz)
                 else:  # Moonset
@@ -284,48 +327,53 @@ class AstronomyService:
         Returns:
             String description of the moon phase
         """
-        # Normalize the angle to 0-360
-        angle = angle % 360
-
-        if angle < 5 or angle > 355:
-            return "New Moon"
-        elif 5 <= angle < 85:
-            return "Waxing Crescent"
-        elif 85 <= angle < 95:
-            return "First Quarter"
-        elif 95 <= angle < 175:
-            return "Waxing Gibbous"
-        elif 175 <= angle < 185:
-            return "Full Moon"
-        elif 185 <= angle < 265:
-            return "Waning Gibbous"
-        elif 265 <= angle < 275:
-            return "Last Quarter"
-        elif 275 <= angle < 355:
-            return "Waning Crescent"
-        else:
-            return "Unknown"
+        # Table lookup on the 10° bin: New Moon within 5° of 0°, First Quarter
+        # within 5° of 90°, and so on
+        return _PHASE_NAME_BINS[int((angle % 360 + 5) // 10) % 36]
+
+    def _get_moon_phase_names(self, angles: np.ndarray) -> List[str]:
+        """
+        Convert an array of moon phase angles to descriptive names.
+
+        Vectorized form of _get_moon_phase_name: the bin indices for all angles
+        are computed in one NumPy pass.
+
+        Args:
+            angles: Moon phase angles in degrees (0-360)
+
+        Returns:
+            List of moon phase names
+        """
+        bins = ((np.mod(angles, 360.0) + 5.0) // 10.0).astype(int) % 36
+        return [_PHASE_NAME_BINS[i] for i in bins.tolist()]
 
     def _get_moon_illumination(self, angle: float) -> int:
         """
         Calculate moon illumination percentage from phase angle.
 
+        Uses the illuminated fraction of the disc, (1 - cos(angle)) / 2.
+
         Args:
             angle: Moon phase angle in degrees (0-360)
 
         Returns:
             Percentage of moon that is illuminated (0-100)
         """
-        # Normalize the angle to 0-360
-        angle = angle % 360
-
-        # For a simplistic model, calculate illumination
-        if angle <= 180:
-            # 0 = new moon (0%), 180 = full moon (100%)
-            return round((angle / 180) * 100)
-        else:
-            # 180 = full moon (100%), 360 = new moon (0%)
-            return round(((360 - angle) / 180) * 100)
+        return int(round(50.0 * (1.0 - math.cos(math.radians(angle)))))
+
+    def _get_moon_illuminations(self, angles: np.ndarray) -> np.ndarray:
+        """
+        Calculate moon illumination percentages for an array of phase angles.
+
+        Vectorized form of _get_moon_illumination.
+
+        Args:
+            angles: Moon phase angles in degrees (0-360)
+
+        Returns:
+            Integer array of illuminated percentages (0-100)
+        """
+        return np.rint(50.0 * (1.0 - np.cos(np.radians(angles)))).astype(int)
 
     def get_all_astronomical_info(
         self, lat: float, lon: float, date: datetime, days: int = 1,
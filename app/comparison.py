@@ -4,12 +4,19 @@ Provider Comparison Module
 Compares FES2022 predictions against multiple commercial tide services
 and generates an HTML comparison report.
 """
+import functools
+import hashlib
 import logging
-import urllib.request
 import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import operator
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
 import os
+import httpx
+import numpy as np
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -26,16 +33,51 @@ API_TIMEOUT_SECONDS = int(os.environ.get('TIDE_TEST_API_TIMEOUT', '10'))
 STORMGLASS_API_KEY = os.environ.get('STORMGLASS_API_KEY', '')
 WORLDTIDES_API_KEY = os.environ.get('WORLDTIDES_API_KEY', '')
 
+# Max concurrent provider requests, shared by all comparison reports
+PROVIDER_FETCH_WORKERS = int(os.environ.get('TIDE_TEST_PROVIDER_FETCH_WORKERS', '8'))
+
+# Optional directory for cached provider responses (disabled when unset)
+PROVIDER_CACHE_DIR = os.environ.get('TIDE_TEST_PROVIDER_CACHE_DIR') or None
+
+# How long provider responses stay in the in-memory cache, and its max entries
+PROVIDER_CACHE_TTL_SECONDS = float(os.environ.get('TIDE_TEST_PROVIDER_CACHE_TTL', '600'))
+PROVIDER_MEMORY_CACHE_SIZE = 256
+
 # Security: Maximum response size from external APIs (1 MB)
 MAX_RESPONSE_SIZE = 1 * 1024 * 1024
 
 
-def safe_read_response(response, max_size: int = MAX_RESPONSE_SIZE) -> bytes:
+# Sort key for tide dicts. Providers return extrema in time order, which
+# Timsort detects in a single pass, so sorting to guarantee order is cheap.
+_BY_DATETIME = operator.itemgetter('datetime')
+
+# Shared pool for provider fetches. Every report and every per-location request
+# (the progressive page loads all locations at once) queues on it, which bounds
+# the concurrent requests to the providers at PROVIDER_FETCH_WORKERS.
+_PROVIDER_EXECUTOR = ThreadPoolExecutor(max_workers=PROVIDER_FETCH_WORKERS, thread_name_prefix='provider-fetch')
+
+# Provider responses keyed like the disk cache, as (expiry in time.monotonic(), tides)
+_PROVIDER_MEMORY_CACHE = {}
+
+# UTC date PROVIDER_CACHE_DIR was last pruned for (see _prune_provider_cache)
+_PROVIDER_CACHE_PRUNED_DAY = None
+
+# Shared HTTP client; keeps connections (and TLS sessions) to each provider
+# open across requests instead of a new handshake per fetch. Thread-safe, so
+# the concurrent fetches share its pool.
+_HTTP_CLIENT = httpx.Client(
+    timeout=API_TIMEOUT_SECONDS,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=PROVIDER_FETCH_WORKERS, max_keepalive_connections=PROVIDER_FETCH_WORKERS),
+)
+
+
+def safe_read_response(response: httpx.Response, max_size: int = MAX_RESPONSE_SIZE) -> bytes:
     """
     Safely read HTTP response with size limit to prevent memory exhaustion.
 
     Args:
-        response: urllib response object
+        response: Streaming httpx response
         max_size: Maximum allowed response size in bytes
 
     Returns:
@@ -49,18 +91,142 @@ def safe_read_response(response, max_size: int = MAX_RESPONSE_SIZE) -> bytes:
     if content_length and int(content_length) > max_size:
         raise ValueError(f"Response too large: {content_length} bytes (max: {max_size})")
 
-    # Read with size limit (read one extra byte to detect overflow)
-    data = response.read(max_size + 1)
-    if len(data) > max_size:
-        raise ValueError(f"Response exceeded size limit of {max_size} bytes")
+    # Read in chunks, stopping as soon as the limit is exceeded
+    data = bytearray()
+    for chunk in response.iter_bytes():
+        data += chunk
+        if len(data) > max_size:
+            raise ValueError(f"Response exceeded size limit of {max_size} bytes")
+
+    return bytes(data)
+
+
+def fetch_json(url: str, headers: Optional[Dict[str, str]] = None):
+    """GET a URL with the shared client and decode its size-limited JSON body.
+
+    Raises:
+        httpx.HTTPError: On connection errors, timeouts and non-2xx responses
+        ValueError: If the response is too large or not valid JSON
+    """
+    with _HTTP_CLIENT.stream('GET', url, headers=headers) as response:
+        response.raise_for_status()
+        return json.loads(safe_read_response(response))
+
+
+def _parse_naive_utc(time_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp into a naive UTC datetime."""
+    if time_str.endswith('Z'):
+        # Already UTC: drop the suffix rather than attach a tzinfo and subtract it again
+        return datetime.fromisoformat(time_str[:-1])
 
-    return data
+    dt = datetime.fromisoformat(time_str)
+    if dt.tzinfo:
+        dt = dt.replace(tzinfo=None) - dt.utcoffset()
+    return dt
+
+
+def _utc_today() -> str:
+    """Return the current UTC date in ISO format."""
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def cached_provider_fetch(provider: str):
+    """Cache a provider fetch function's results in memory and, optionally, on disk.
+
+    Results are keyed by provider, call arguments and UTC date. They are kept
+    in memory for PROVIDER_CACHE_TTL_SECONDS, so reloading the comparison page
+    doesn't refetch every location. When PROVIDER_CACHE_DIR is set they are
+    also written there as JSON, so reruns on the same day skip the HTTP
+    request and don't spend API quota. Failed fetches (None) are not cached.
+    """
+    def decorator(fetch):
+        @functools.wraps(fetch)
+        def wrapper(*args, **kwargs):
+            day = _utc_today()
+            key = '|'.join(
+                [provider, day]
+                + [repr(arg) for arg in args]
+                + [f"{name}={value!r}" for name, value in sorted(kwargs.items())]
+            )
+
+            cached = _PROVIDER_MEMORY_CACHE.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            tides = _fetch_with_disk_cache(provider, day, key, fetch, args, kwargs)
+
+            if tides is not None:
+                # Evict the oldest entry so the cache can't grow without bound
+                if len(_PROVIDER_MEMORY_CACHE) >= PROVIDER_MEMORY_CACHE_SIZE:
+                    _PROVIDER_MEMORY_CACHE.pop(next(iter(_PROVIDER_MEMORY_CACHE)), None)
+                _PROVIDER_MEMORY_CACHE[key] = (time.monotonic() + PROVIDER_CACHE_TTL_SECONDS, tides)
+            return tides
+
+        return wrapper
+    return decorator
+
+
+def _fetch_with_disk_cache(provider: str, day: str, key: str, fetch, args, kwargs) -> Optional[List[Dict]]:
+    """Call fetch, reading and writing its result in PROVIDER_CACHE_DIR if set.
+
+    Files are named "<UTC date>_<key hash>.json" so earlier days can be pruned.
+    """
+    if PROVIDER_CACHE_DIR is None:
+        return fetch(*args, **kwargs)
+
+    path = os.path.join(PROVIDER_CACHE_DIR, f"{day}_{hashlib.sha256(key.encode()).hexdigest()}.json")
+
+    try:
+        with open(path) as f:
+            return [
+                {**tide, 'datetime': datetime.fromisoformat(tide['datetime'])}
+                for tide in json.load(f)
+            ]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    tides = fetch(*args, **kwargs)
+    if tides is not None:
+        try:
+            os.makedirs(PROVIDER_CACHE_DIR, exist_ok=True)
+            _prune_provider_cache(day)
+            # A unique temp file per write: fetches of the same key can run
+            # concurrently on the provider pool and must not share one
+            fd, tmp_path = tempfile.mkstemp(dir=PROVIDER_CACHE_DIR, prefix=f"{day}_", suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump([{**tide, 'datetime': tide['datetime'].isoformat()} for tide in tides], f)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError as e:
+            logger.warning(f"Could not cache {provider} response: {e}")
+    return tides
+
+
+def _prune_provider_cache(day: str) -> None:
+    """Delete cache files from UTC dates before day, once per day."""
+    global _PROVIDER_CACHE_PRUNED_DAY
+    if _PROVIDER_CACHE_PRUNED_DAY == day:
+        return
+    _PROVIDER_CACHE_PRUNED_DAY = day
+
+    for name in os.listdir(PROVIDER_CACHE_DIR):
+        file_day, sep, _ = name.partition('_')
+        # Only touch our own files (ISO date prefix); ISO dates sort chronologically
+        if sep and len(file_day) == len(day) and file_day < day and name.endswith(('.json', '.tmp')):
+            try:
+                os.remove(os.path.join(PROVIDER_CACHE_DIR, name))
+            except OSError:
+                pass
 
 
 # Import test locations from app module (not tests, to ensure availability in production)
-from app.locations import TEST_LOCATIONS
+from app.locations import TEST_LOCATIONS_BY_KEY
 
 
+@cached_provider_fetch('NOAA')
 def fetch_noaa_tides(station_id: Optional[str], days: int = 3) -> Optional[List[Dict]]:
     """Fetch tide data from NOAA CO-OPS API."""
     if not station_id:
@@ -77,8 +243,7 @@ def fetch_noaa_tides(station_id: Optional[str], days: int = 3) -> Optional[List[
            f"&datum=MLLW&time_zone=gmt&units=metric&format=json&interval=hilo")
 
     try:
-        with urllib.request.urlopen(url, timeout=API_TIMEOUT_SECONDS) as response:
-            data = json.loads(safe_read_response(response).decode())
+        data = fetch_json(url)
 
         extrema = []
         for entry in data.get('predictions', []):
@@ -87,7 +252,8 @@ def fetch_noaa_tides(station_id: Optional[str], days: int = 3) -> Optional[List[
             tide_type = entry.get('type', '').upper()
 
             if time_str and height_str and tide_type in ('H', 'L'):
-                dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M')
+                # 'YYYY-MM-DD HH:MM' is ISO 8601; fromisoformat parses it in C
+                dt = datetime.fromisoformat(time_str)
                 extrema.append({
                     'provider': 'NOAA',
                     'type': 'high' if tide_type == 'H' else 'low',
@@ -95,21 +261,22 @@ def fetch_noaa_tides(station_id: Optional[str], days: int = 3) -> Optional[List[
                     'height_m': float(height_str),
                 })
 
-        return sorted(extrema, key=lambda x: x['datetime'])
+        extrema.sort(key=_BY_DATETIME)
+        return extrema
     except Exception as e:
         logger.warning(f"NOAA fetch failed: {e}")
         return None
 
 
+@cached_provider_fetch('WorldTides')
 def fetch_worldtides_tides(lat: float, lon: float, days: int = 3) -> Optional[List[Dict]]:
     """Fetch tide data from WorldTides API."""
     if not WORLDTIDES_API_KEY:
         return None
 
-    import time
-
-    start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    start_timestamp = int(time.mktime(start.timetuple()))
+    # Today's UTC midnight as a Unix timestamp
+    now = int(time.time())
+    start_timestamp = now - now % 86400
     length_seconds = days * 86400
 
     url = (f"https://www.worldtides.info/api/v3?"
@@ -118,8 +285,7 @@ def fetch_worldtides_tides(lat: float, lon: float, days: int = 3) -> Optional[Li
            f"&key={WORLDTIDES_API_KEY}")
 
     try:
-        with urllib.request.urlopen(url, timeout=API_TIMEOUT_SECONDS) as response:
-            data = json.loads(safe_read_response(response).decode())
+        data = fetch_json(url)
 
         extrema = []
         for entry in data.get('extremes', []):
@@ -136,12 +302,14 @@ def fetch_worldtides_tides(lat: float, lon: float, days: int = 3) -> Optional[Li
                     'height_m': height,
                 })
 
-        return sorted(extrema, key=lambda x: x['datetime'])
+        extrema.sort(key=_BY_DATETIME)
+        return extrema
     except Exception as e:
         logger.warning(f"WorldTides fetch failed: {e}")
         return None
 
 
+@cached_provider_fetch('StormGlass')
 def fetch_stormglass_tides(lat: float, lon: float, days: int = 3) -> Optional[List[Dict]]:
     """Fetch tide data from Storm Glass API."""
     if not STORMGLASS_API_KEY:
@@ -157,9 +325,7 @@ def fetch_stormglass_tides(lat: float, lon: float, days: int = 3) -> Optional[Li
     headers = {'Authorization': STORMGLASS_API_KEY}
 
     try:
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=API_TIMEOUT_SECONDS) as response:
-            data = json.loads(safe_read_response(response).decode())
+        data = fetch_json(url, headers=headers)
 
         extrema = []
         for entry in data.get('data', []):
@@ -168,9 +334,7 @@ def fetch_stormglass_tides(lat: float, lon: float, days: int = 3) -> Optional[Li
             height = entry.get('height')
 
             if tide_type and time_str and height is not None:
-                dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                if dt.tzinfo:
-                    dt = dt.replace(tzinfo=None) - dt.utcoffset()
+                dt = _parse_naive_utc(time_str)
 
                 extrema.append({
                     'provider': 'StormGlass',
@@ -179,57 +343,305 @@ def fetch_stormglass_tides(lat: float, lon: float, days: int = 3) -> Optional[Li
                     'height_m': height,
                 })
 
-        return sorted(extrema, key=lambda x: x['datetime'])
+        extrema.sort(key=_BY_DATETIME)
+        return extrema
     except Exception as e:
         logger.warning(f"Storm Glass fetch failed: {e}")
         return None
 
 
-def calculate_tidal_ranges(tides: List[Dict]) -> List[Dict]:
-    """Calculate tidal range between consecutive tides."""
-    result = []
-    for i, tide in enumerate(tides):
-        tide_with_range = tide.copy()
-        if i > 0:
-            prev = tides[i - 1]
-            tide_with_range['range_from_prev'] = abs(tide['height_m'] - prev['height_m'])
-        else:
-            tide_with_range['range_from_prev'] = None
-        result.append(tide_with_range)
-    return result
+def _resolved(value) -> Future:
+    """Return a future that has already completed with value."""
+    future = Future()
+    future.set_result(value)
+    return future
 
 
-def find_matching_tide(target: Dict, tides: List[Dict], max_time_diff_hours: float = 6.0) -> Optional[Dict]:
-    """Find the best matching tide from a list.
+def submit_provider_fetches(executor: ThreadPoolExecutor, location, days: int = 3) -> Dict[str, Future]:
+    """Start fetching tide data for a location from all providers on an executor.
 
-    Uses a 6-hour window to account for FES2022 timing differences in coastal areas.
+    Providers without an API key (or, for NOAA, without a station) are not
+    scheduled at all; their futures are already resolved to None so the
+    report still lists them as unavailable.
+
+    Returns:
+        Dict mapping provider name to the future of its fetch
+    """
+    return {
+        'NOAA': (
+            executor.submit(fetch_noaa_tides, location.noaa_station_id, days)
+            if location.noaa_station_id else _resolved(None)
+        ),
+        'StormGlass': (
+            executor.submit(fetch_stormglass_tides, location.lat, location.lon, days)
+            if STORMGLASS_API_KEY else _resolved(None)
+        ),
+        'WorldTides': (
+            executor.submit(fetch_worldtides_tides, location.lat, location.lon, days)
+            if WORLDTIDES_API_KEY else _resolved(None)
+        ),
+    }
+
+
+def collect_provider_tides(futures: Dict[str, Future]) -> Dict[str, Optional[List[Dict]]]:
+    """Wait for fetches started by submit_provider_fetches and return their results."""
+    return {name: future.result() for name, future in futures.items()}
+
+
+def calculate_tidal_ranges(tides: List[Dict]) -> List[Optional[float]]:
+    """Calculate tidal range between consecutive tides.
+
+    Returns:
+        Range from the previous tide for each tide (None for the first)
     """
     if not tides:
-        return None
+        return []
+    return [None] + np.abs(np.diff([tide['height_m'] for tide in tides])).tolist()
+
 
-    best_match = None
-    best_diff = float('inf')
+def _to_microseconds(datetimes: List[datetime]) -> np.ndarray:
+    """Convert naive UTC datetimes to int64 microseconds since the epoch."""
+    return np.array(datetimes, dtype='datetime64[us]').astype(np.int64)
 
-    for tide in tides:
-        if tide['type'] != target['type']:
+
+def index_tides_by_type(tides: List[Dict]) -> Dict[str, Tuple[np.ndarray, List[int]]]:
+    """Group tides by type, each group sorted by time, for match_tides.
+
+    Returns:
+        Dict mapping tide type to a (times in epoch microseconds, positions in tides) pair
+    """
+    grouped = {}
+    for position in sorted(range(len(tides)), key=lambda i: tides[i]['datetime']):
+        grouped.setdefault(tides[position]['type'], []).append(position)
+    return {
+        tide_type: (_to_microseconds([tides[i]['datetime'] for i in positions]), positions)
+        for tide_type, positions in grouped.items()
+    }
+
+
+def match_tides(
+    targets: List[Dict], index: Dict[str, Tuple[np.ndarray, List[int]]], max_time_diff_hours: float = 6.0
+) -> List[Optional[int]]:
+    """Find the best matching tide for each target in an index built by index_tides_by_type.
+
+    Uses a 6-hour window to account for FES2022 timing differences in coastal areas.
+    The closest tide of the same type is one of the two neighbours of the target
+    time, so all targets of a type are matched with one searchsorted call.
+
+    Returns:
+        Position of the matching tide in the indexed list (or None) for each target,
+        in target order
+    """
+    matches = [None] * len(targets)
+    if not targets or not index:
+        return matches
+
+    target_times = _to_microseconds([target['datetime'] for target in targets])
+    target_types = np.array([target['type'] for target in targets])
+    max_diff = max_time_diff_hours * 3600 * 1e6
+
+    for tide_type, (times, positions) in index.items():
+        rows = np.flatnonzero(target_types == tide_type)
+        if rows.size == 0:
             continue
 
-        diff_minutes = abs((tide['datetime'] - target['datetime']).total_seconds() / 60)
+        t = target_times[rows]
+        position = np.searchsorted(times, t, side='left')
+
+        # Earlier neighbour is the first of any equal times, so ties go to the
+        # tide a linear scan would have found first
+        earlier = np.searchsorted(times, times[np.maximum(position - 1, 0)], side='left')
+        later = np.minimum(position, len(times) - 1)
+        earlier_diff = np.where(position > 0, np.abs(times[earlier] - t), np.inf)
+        later_diff = np.where(position < len(times), np.abs(times[later] - t), np.inf)
+
+        best = np.where(later_diff < earlier_diff, later, earlier)
+        within = np.minimum(earlier_diff, later_diff) <= max_diff
+
+        for row, i, ok in zip(rows.tolist(), best.tolist(), within.tolist()):
+            if ok:
+                matches[row] = positions[i]
 
-        if diff_minutes < best_diff and diff_minutes <= max_time_diff_hours * 60:
-            best_diff = diff_minutes
-            best_match = tide
+    return matches
 
-    return best_match
 
+def find_matching_tide(target: Dict, tides: List[Dict], max_time_diff_hours: float = 6.0) -> Optional[Dict]:
+    """Find the best matching tide from a list (see match_tides)."""
+    position = match_tides([target], index_tides_by_type(tides), max_time_diff_hours)[0]
+    return None if position is None else tides[position]
+
+
+# Comparison table row fragments, filled in per tide by _render_location_comparison
+_ROW_START = """
+                <tr class="{row_class}">
+                    <td><strong>{type}</strong></td>
+                    <td>{time}</td>
+                    <td>{range}</td>
+"""
+_CELL = "                    <td>{value}</td>\n"
+_DELTA_CELL = "                    <td>{value} <span class='{delta_class}'>({delta})</span></td>\n"
+_NO_MATCH_CELLS = "                    <td class='na'>—</td>\n" * 2
+_NO_DATA_CELLS = "                    <td class='na'>N/A</td>\n" * 2
+_STATUS_ERROR_CELL = '                    <td><span class="status-error">⚠️</span></td>\n                </tr>\n'
+_STATUS_NONE_CELL = '                    <td><span class="na">—</span></td>\n                </tr>\n'
+_STATUS_OK_CELL = '                    <td><span class="status-ok">✓</span></td>\n                </tr>\n'
+
+
+def _render_location_comparison(our_tides: List[Dict], provider_tides: Dict[str, Optional[List[Dict]]]) -> str:
+    """Render the provider status and comparison table for one location.
+
+    Ranges and matches are computed once per provider up front, and every row
+    of the table reads from them.
+
+    Args:
+        our_tides: FES2022 extrema as naive UTC datetimes
+        provider_tides: Provider name to its extrema (None if unavailable)
+
+    Returns:
+        HTML fragment closing the location's section div
+    """
+    html = ''
+
+    # Sorted once; the status badges, header and every row use this order
+    provider_names = sorted(provider_tides)
+
+    # Provider status
+    html += '        <div class="providers">\n'
+    html += f'            <span class="provider-status provider-active">✓ FES2022: {len(our_tides)}</span>\n'
+    for provider_name in provider_names:
+        tides = provider_tides[provider_name]
+        if tides:
+            html += f'            <span class="provider-status provider-active">✓ {provider_name}: {len(tides)}</span>\n'
+        else:
+            html += f'            <span class="provider-status provider-inactive">✗ {provider_name}: N/A</span>\n'
+    html += '        </div>\n\n'
+
+    # Calculate ranges and match each of our tides against every provider
+    our_ranges = calculate_tidal_ranges(our_tides)
+    provider_ranges = {
+        name: calculate_tidal_ranges(tides) if tides else None
+        for name, tides in provider_tides.items()
+    }
+    provider_matches = {
+        name: match_tides(our_tides, index_tides_by_type(tides)) if tides else None
+        for name, tides in provider_tides.items()
+    }
+
+    # Build table
+    html += """
+        <table>
+            <thead>
+                <tr>
+                    <th>Type</th>
+                    <th>FES2022 Time</th>
+                    <th>FES2022 Range</th>
+"""
+
+    for provider_name in provider_names:
+        html += f"                    <th>{provider_name} Time</th>\n"
+        html += f"                    <th>{provider_name} Range</th>\n"
+
+    html += """
+                    <th>Status</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
 
-def generate_all_locations_html(days: int = 3) -> str:
+    # Show all tides; rows are collected as parts and joined once at the end
+    rows = []
+    for row, (our_tide, our_range) in enumerate(zip(our_tides, our_ranges)):
+        rows.append(_ROW_START.format(
+            row_class='high' if our_tide['type'] == 'high' else 'low',
+            type=our_tide['type'].upper(),
+            time=our_tide['datetime'].strftime('%m/%d %H:%M'),
+            range=f"{our_range:.2f}m" if our_range else '—',
+        ))
+
+        time_checks = []
+        range_checks = []
+
+        for provider_name in provider_names:
+            matches = provider_matches[provider_name]
+
+            if matches is not None:
+                position = matches[row]
+                if position is not None:
+                    match = provider_tides[provider_name][position]
+                    match_range = provider_ranges[provider_name][position]
+
+                    # Time comparison
+                    time_diff = (match['datetime'] - our_tide['datetime']).total_seconds() / 60
+                    time_ok = abs(time_diff) <= TIME_TOLERANCE_MINUTES
+                    time_checks.append(time_ok)
+                    rows.append(_DELTA_CELL.format(
+                        value=match['datetime'].strftime('%m/%d %H:%M'),
+                        delta_class='delta-good' if time_ok else 'delta-bad',
+                        delta=f"{time_diff:+.0f}min",
+                    ))
+
+                    # Range comparison
+                    range_str = f"{match_range:.2f}m" if match_range else '—'
+
+                    if our_range is not None and match_range is not None:
+                        range_diff = match_range - our_range
+                        range_ok = abs(range_diff) <= RANGE_TOLERANCE_METERS
+                        range_checks.append(range_ok)
+                        rows.append(_DELTA_CELL.format(
+                            value=range_str,
+                            delta_class='delta-good' if range_ok else 'delta-bad',
+                            delta=f"{range_diff:+.2f}m",
+                        ))
+                    else:
+                        rows.append(_CELL.format(value=range_str))
+                else:
+                    rows.append(_NO_MATCH_CELLS)
+            else:
+                rows.append(_NO_DATA_CELLS)
+
+        # Status
+        time_issue = False in time_checks
+        range_issue = False in range_checks
+
+        if time_issue or range_issue:
+            rows.append(_STATUS_ERROR_CELL)
+        elif not time_checks and not range_checks:
+            rows.append(_STATUS_NONE_CELL)
+        else:
+            rows.append(_STATUS_OK_CELL)
+
+    html += ''.join(rows)
+
+    html += """
+            </tbody>
+        </table>
+    </div>
+"""
+
+    return html
+
+
+# Tide service for callers that don't pass one in, created on first use (see _get_tide_service)
+_TIDE_SERVICE = None
+
+
+def _get_tide_service():
+    """Return the module-wide tide service, creating it on first use."""
+    global _TIDE_SERVICE
+    if _TIDE_SERVICE is None:
+        from app.tide_service import FES2022TideService
+
+        _TIDE_SERVICE = FES2022TideService(data_path=os.environ.get('FES_DATA_PATH', './'))
+    return _TIDE_SERVICE
+
+
+def generate_all_locations_html(days: int = 3, service=None) -> str:
     """Generate HTML comparison report for all test locations.
 
     Args:
         days: Number of days to predict
+        service: FES2022TideService to predict with (default: a shared one reading FES_DATA_PATH)
     """
-    from app.tide_service import FES2022TideService
 
     html = f"""
 <!DOCTYPE html>
@@ -388,29 +800,39 @@ def generate_all_locations_html(days: int = 3) -> str:
     </script>
 """
 
-    service = FES2022TideService(data_path=os.environ.get('FES_DATA_PATH', './'))
+    if service is None:
+        service = _get_tide_service()
 
     # Process all locations
-    location_keys = sorted(TEST_LOCATIONS.keys())
+    location_keys = sorted(TEST_LOCATIONS_BY_KEY)
+
+    locations = [TEST_LOCATIONS_BY_KEY[location_key] for location_key in location_keys]
 
-    for location_key in location_keys:
-        location = TEST_LOCATIONS[location_key]
+    # Start every location's provider requests up front so they run while we
+    # compute the FES2022 predictions below
+    provider_futures = [
+        submit_provider_fetches(_PROVIDER_EXECUTOR, location, days) for location in locations
+    ]
+
+    # Predict every location in one batch (one constituent-major read, shared time factors)
+    all_predictions = service.predict_tides_batch(
+        [(location.lat, location.lon) for location in locations], days=days
+    )
+
+    for location, our_predictions, location_futures in zip(locations, all_predictions, provider_futures):
 
         html += f"""
     <div class="location-section">
         <div class="location-header">
-            <h2>{location['name']}</h2>
-            <span class="coords">{location['lat']:.6f}, {location['lon']:.6f}</span>
+            <h2>{location.name}</h2>
+            <span class="coords">{location.lat:.6f}, {location.lon:.6f}</span>
         </div>
 """
 
-        # Fetch predictions
-        our_predictions = service.predict_tides(lat=location['lat'], lon=location['lon'], days=days)
+        # Convert predictions
         our_tides = []
         for t in our_predictions:
-            dt = datetime.fromisoformat(t['datetime'].replace('Z', '+00:00'))
-            if dt.tzinfo:
-                dt = dt.replace(tzinfo=None) - dt.utcoffset()
+            dt = _parse_naive_utc(t['datetime'])
             our_tides.append({
                 'provider': 'FES2022',
                 'type': t['type'],
@@ -419,122 +841,9 @@ def generate_all_locations_html(days: int = 3) -> str:
             })
 
         # Fetch from providers
-        provider_tides = {
-            'NOAA': fetch_noaa_tides(location.get('noaa_station_id'), days),
-            'StormGlass': fetch_stormglass_tides(location['lat'], location['lon'], days),
-            'WorldTides': fetch_worldtides_tides(location['lat'], location['lon'], days),
-        }
-
-        # Provider status
-        html += '        <div class="providers">\n'
-        html += f'            <span class="provider-status provider-active">✓ FES2022: {len(our_tides)}</span>\n'
-        for provider_name in sorted(provider_tides.keys()):
-            tides = provider_tides[provider_name]
-            if tides:
-                html += f'            <span class="provider-status provider-active">✓ {provider_name}: {len(tides)}</span>\n'
-            else:
-                html += f'            <span class="provider-status provider-inactive">✗ {provider_name}: N/A</span>\n'
-        html += '        </div>\n\n'
-
-        # Calculate ranges
-        our_tides_with_range = calculate_tidal_ranges(our_tides)
-        provider_ranges = {
-            name: calculate_tidal_ranges(tides) if tides else None
-            for name, tides in provider_tides.items()
-        }
-
-        # Build table with all tides
-        html += """
-        <table>
-            <thead>
-                <tr>
-                    <th>Type</th>
-                    <th>FES2022 Time</th>
-                    <th>FES2022 Range</th>
-"""
-
-        for provider_name in sorted(provider_tides.keys()):
-            html += f"                    <th>{provider_name} Time</th>\n"
-            html += f"                    <th>{provider_name} Range</th>\n"
-
-        html += """
-                    <th>Status</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
-
-        # Show all tides for each location
-        for our_tide in our_tides_with_range:
-            row_class = 'high' if our_tide['type'] == 'high' else 'low'
-
-            our_range_str = f"{our_tide['range_from_prev']:.2f}m" if our_tide['range_from_prev'] else '—'
-
-            html += f"""
-                <tr class="{row_class}">
-                    <td><strong>{our_tide['type'].upper()}</strong></td>
-                    <td>{our_tide['datetime'].strftime('%m/%d %H:%M')}</td>
-                    <td>{our_range_str}</td>
-"""
-
-            time_checks = []
-            range_checks = []
-
-            for provider_name in sorted(provider_tides.keys()):
-                provider_data = provider_ranges[provider_name]
-
-                if provider_data:
-                    match = find_matching_tide(our_tide, provider_data)
-                    if match:
-                        # Time comparison
-                        time_diff = (match['datetime'] - our_tide['datetime']).total_seconds() / 60
-                        time_ok = abs(time_diff) <= TIME_TOLERANCE_MINUTES
-                        time_checks.append(time_ok)
-
-                        delta_class = 'delta-good' if time_ok else 'delta-bad'
-                        time_str = match['datetime'].strftime('%m/%d %H:%M')
-                        time_delta = f"<span class='{delta_class}'>({time_diff:+.0f}min)</span>"
-                        html += f"                    <td>{time_str} {time_delta}</td>\n"
-
-                        # Range comparison
-                        range_str = f"{match['range_from_prev']:.2f}m" if match['range_from_prev'] else '—'
-
-                        if our_tide['range_from_prev'] is not None and match['range_from_prev'] is not None:
-                            range_diff = match['range_from_prev'] - our_tide['range_from_prev']
-                            range_ok = abs(range_diff) <= RANGE_TOLERANCE_METERS
-                            range_checks.append(range_ok)
-
-                            range_delta_class = 'delta-good' if range_ok else 'delta-bad'
-                            range_delta = f"<span class='{range_delta_class}'>({range_diff:+.2f}m)</span>"
-                            html += f"                    <td>{range_str} {range_delta}</td>\n"
-                        else:
-                            html += f"                    <td>{range_str}</td>\n"
-                    else:
-                        html += "                    <td class='na'>—</td>\n"
-                        html += "                    <td class='na'>—</td>\n"
-                else:
-                    html += "                    <td class='na'>N/A</td>\n"
-                    html += "                    <td class='na'>N/A</td>\n"
+        provider_tides = collect_provider_tides(location_futures)
 
-            # Status
-            time_issue = False in time_checks
-            range_issue = False in range_checks
-
-            if time_issue or range_issue:
-                status = '<span class="status-error">⚠️</span>'
-            elif not time_checks and not range_checks:
-                status = '<span class="na">—</span>'
-            else:
-                status = '<span class="status-ok">✓</span>'
-
-            html += f"                    <td>{status}</td>\n"
-            html += "                </tr>\n"
-
-        html += """
-            </tbody>
-        </table>
-    </div>
-"""
+        html += _render_location_comparison(our_tides, provider_tides)
 
     html += """
 </body>
@@ -544,39 +853,40 @@ def generate_all_locations_html(days: int = 3) -> str:
     return html
 
 
-def generate_single_location_html(location_key: str, days: int = 3) -> str:
+def generate_single_location_html(location_key: str, days: int = 3, service=None) -> str:
     """Generate HTML fragment for a single location comparison.
 
     Args:
-        location_key: Key for the location in TEST_LOCATIONS
+        location_key: Key for the location in TEST_LOCATIONS_BY_KEY
         days: Number of days to predict
+        service: FES2022TideService to predict with (default: a shared one reading FES_DATA_PATH)
 
     Returns:
         HTML fragment (div element) for a single location
     """
-    from app.tide_service import FES2022TideService
-
-    if location_key not in TEST_LOCATIONS:
+    if location_key not in TEST_LOCATIONS_BY_KEY:
         return f'<div class="location-section" style="background: #fee;"><h2>Unknown location: {location_key}</h2></div>'
 
-    location = TEST_LOCATIONS[location_key]
-    service = FES2022TideService(data_path=os.environ.get('FES_DATA_PATH', './'))
+    location = TEST_LOCATIONS_BY_KEY[location_key]
+    if service is None:
+        service = _get_tide_service()
 
     html = f"""
     <div class="location-section" id="location-{location_key}">
         <div class="location-header">
-            <h2>{location['name']}</h2>
-            <span class="coords">{location['lat']:.6f}, {location['lon']:.6f}</span>
+            <h2>{location.name}</h2>
+            <span class="coords">{location.lat:.6f}, {location.lon:.6f}</span>
         </div>
 """
 
+    # Start the provider requests first so they run while we compute our prediction
+    provider_futures = submit_provider_fetches(_PROVIDER_EXECUTOR, location, days)
+
     # Fetch predictions
-    our_predictions = service.predict_tides(lat=location['lat'], lon=location['lon'], days=days)
+    our_predictions = service.predict_tides(lat=location.lat, lon=location.lon, days=days)
     our_tides = []
     for t in our_predictions:
-        dt = datetime.fromisoformat(t['datetime'].replace('Z', '+00:00'))
-        if dt.tzinfo:
-            dt = dt.replace(tzinfo=None) - dt.utcoffset()
+        dt = _parse_naive_utc(t['datetime'])
         our_tides.append({
             'provider': 'FES2022',
             'type': t['type'],
@@ -585,121 +895,9 @@ def generate_single_location_html(location_key: str, days: int = 3) -> str:
         })
 
     # Fetch from providers
-    provider_tides = {
-        'NOAA': fetch_noaa_tides(location.get('noaa_station_id'), days),
-        'StormGlass': fetch_stormglass_tides(location['lat'], location['lon'], days),
-        'WorldTides': fetch_worldtides_tides(location['lat'], location['lon'], days),
-    }
+    provider_tides = collect_provider_tides(provider_futures)
 
-    # Provider status
-    html += '        <div class="providers">\n'
-    html += f'            <span class="provider-status provider-active">✓ FES2022: {len(our_tides)}</span>\n'
-    for provider_name in sorted(provider_tides.keys()):
-        tides = provider_tides[provider_name]
-        if tides:
-            html += f'            <span class="provider-status provider-active">✓ {provider_name}: {len(tides)}</span>\n'
-        else:
-            html += f'            <span class="provider-status provider-inactive">✗ {provider_name}: N/A</span>\n'
-    html += '        </div>\n\n'
-
-    # Calculate ranges
-    our_tides_with_range = calculate_tidal_ranges(our_tides)
-    provider_ranges = {
-        name: calculate_tidal_ranges(tides) if tides else None
-        for name, tides in provider_tides.items()
-    }
-
-    # Build table
-    html += """
-        <table>
-            <thead>
-                <tr>
-                    <th>Type</th>
-                    <th>FES2022 Time</th>
-                    <th>FES2022 Range</th>
-"""
-
-    for provider_name in sorted(provider_tides.keys()):
-        html += f"                    <th>{provider_name} Time</th>\n"
-        html += f"                    <th>{provider_name} Range</th>\n"
-
-    html += """
-                    <th>Status</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
-
-    # Show all tides
-    for our_tide in our_tides_with_range:
-        row_class = 'high' if our_tide['type'] == 'high' else 'low'
-        our_range_str = f"{our_tide['range_from_prev']:.2f}m" if our_tide['range_from_prev'] else '—'
-
-        html += f"""
-                <tr class="{row_class}">
-                    <td><strong>{our_tide['type'].upper()}</strong></td>
-                    <td>{our_tide['datetime'].strftime('%m/%d %H:%M')}</td>
-                    <td>{our_range_str}</td>
-"""
-
-        time_checks = []
-        range_checks = []
-
-        for provider_name in sorted(provider_tides.keys()):
-            provider_data = provider_ranges[provider_name]
-
-            if provider_data:
-                match = find_matching_tide(our_tide, provider_data)
-                if match:
-                    # Time comparison
-                    time_diff = (match['datetime'] - our_tide['datetime']).total_seconds() / 60
-                    time_ok = abs(time_diff) <= TIME_TOLERANCE_MINUTES
-                    time_checks.append(time_ok)
-
-                    delta_class = 'delta-good' if time_ok else 'delta-bad'
-                    time_str = match['datetime'].strftime('%m/%d %H:%M')
-                    time_delta = f"<span class='{delta_class}'>({time_diff:+.0f}min)</span>"
-                    html += f"                    <td>{time_str} {time_delta}</td>\n"
-
-                    # Range comparison
-                    range_str = f"{match['range_from_prev']:.2f}m" if match['range_from_prev'] else '—'
-
-                    if our_tide['range_from_prev'] is not None and match['range_from_prev'] is not None:
-                        range_diff = match['range_from_prev'] - our_tide['range_from_prev']
-                        range_ok = abs(range_diff) <= RANGE_TOLERANCE_METERS
-                        range_checks.append(range_ok)
-
-                        range_delta_class = 'delta-good' if range_ok else 'delta-bad'
-                        range_delta = f"<span class='{range_delta_class}'>({range_diff:+.2f}m)</span>"
-                        html += f"                    <td>{range_str} {range_delta}</td>\n"
-                    else:
-                        html += f"                    <td>{range_str}</td>\n"
-                else:
-                    html += "                    <td class='na'>—</td>\n"
-                    html += "                    <td class='na'>—</td>\n"
-            else:
-                html += "                    <td class='na'>N/A</td>\n"
-                html += "                    <td class='na'>N/A</td>\n"
-
-        # Status
-        time_issue = False in time_checks
-        range_issue = False in range_checks
-
-        if time_issue or range_issue:
-            status = '<span class="status-error">⚠️</span>'
-        elif not time_checks and not range_checks:
-            status = '<span class="na">—</span>'
-        else:
-            status = '<span class="status-ok">✓</span>'
-
-        html += f"                    <td>{status}</td>\n"
-        html += "                </tr>\n"
-
-    html += """
-            </tbody>
-        </table>
-    </div>
-"""
+    html += _render_location_comparison(our_tides, provider_tides)
 
     return html
 
@@ -715,7 +913,7 @@ def generate_comparison_shell_html(days: int = 3) -> str:
     Returns:
         Complete HTML page with progressive loading
     """
-    location_keys = sorted(TEST_LOCATIONS.keys())
+    location_keys = sorted(TEST_LOCATIONS_BY_KEY)
     location_keys_json = json.dumps(location_keys)
 
     html = f"""
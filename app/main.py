@@ -1,10 +1,13 @@
+import heapq
 import logging
 import os
+import threading
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Literal, Optional
 
-from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -29,10 +32,23 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the FES2022 constituent files before serving requests (unless deferred)."""
+    if not DEFER_FES_LOAD:
+        opened = get_tide_service().open_datasets()
+        logger.info("Opened %d FES2022 constituent datasets", opened)
+    yield
+    # Close the NetCDF handles on shutdown
+    if _tide_service is not None:
+        _tide_service.close()
+
+
 app = FastAPI(
     title="Sun Moon Tides API",
     description="Worldwide tide predictions and astronomy data using FES2022",
     version="2.0.0",
+    lifespan=lifespan,
 )
 
 # Set up rate limiter
@@ -46,7 +62,29 @@ app.add_middleware(SecurityHeadersMiddleware)
 # Initialize services
 # Default to current directory for local dev, /data for Docker
 DATA_PATH = os.getenv("FES_DATA_PATH", ".")
-tide_service = FES2022TideService(data_path=DATA_PATH)
+# Optional directory for memory-mapped constituent grids (disabled when unset)
+GRID_CACHE_DIR = os.getenv("FES_GRID_CACHE_DIR")
+# Set DEFER_FES_LOAD=1 to create the tide service on the first tide request instead of at import
+DEFER_FES_LOAD = os.getenv("DEFER_FES_LOAD", "") not in ("", "0")
+
+_tide_service: Optional[FES2022TideService] = None
+# FastAPI resolves sync dependencies on its threadpool, so concurrent first requests
+# could otherwise each build a service (and leak the NetCDF handles of all but one)
+_tide_service_lock = threading.Lock()
+
+
+def get_tide_service() -> FES2022TideService:
+    """Return the shared tide service, creating it on first use."""
+    global _tide_service
+    if _tide_service is None:
+        with _tide_service_lock:
+            if _tide_service is None:
+                _tide_service = FES2022TideService(data_path=DATA_PATH, grid_cache_dir=GRID_CACHE_DIR)
+    return _tide_service
+
+
+if not DEFER_FES_LOAD:
+    get_tide_service()
 astronomy_service = AstronomyService()
 
 
@@ -65,6 +103,7 @@ async def get_tides(
         "msl",
         description="Tidal datum reference: 'msl' (Mean Sea Level), 'mllw' (Mean Lower Low Water), or 'lat' (Lowest Astronomical Tide)",
     ),
+    tide_service: FES2022TideService = Depends(get_tide_service),
 ):
     """
     Get tide predictions for a location.
@@ -101,43 +140,16 @@ async def get_tides(
                 datum=datum_enum,
             )
 
-            # Combine heights and events, then sort by datetime
-            combined = []
-
-            # Add all interval heights (without type field)
-            for height in heights:
-                combined.append(
-                    {
-                        "datetime": height["datetime"],
-                        "height_m": height["height_m"],
-                        "height_ft": height["height_ft"],
-                        "datum": height["datum"],
-                    }
-                )
-
-            # Add high/low events with type field at their exact times
-            for event in events:
-                combined.append(
-                    {
-                        "type": event["type"],
-                        "datetime": event["datetime"],
-                        "height_m": event["height_m"],
-                        "height_ft": event["height_ft"],
-                        "datum": event["datum"],
-                    }
-                )
-
-            # Sort by datetime
-            def parse_datetime_for_sort(dt_str):
+            # Both lists are already in time order and carry exactly the response fields
+            # (only high/low events have a 'type' key), so merge them as-is instead of
+            # copying every entry and re-sorting the combined list
+            def parse_datetime_for_sort(entry):
+                dt_str = entry["datetime"]
                 if dt_str.endswith("Z"):
                     dt_str = dt_str[:-1] + "+00:00"
                 return datetime.fromisoformat(dt_str)
 
-            combined.sort(key=lambda x: parse_datetime_for_sort(x["datetime"]))
-
-            # Return the combined list directly - regular interval points don't have 'type' key
-            # Only high/low events have 'type' key, so no need to filter None values
-            return combined
+            return list(heapq.merge(heights, events, key=parse_datetime_for_sort))
     except ValueError as e:
         raise HTTPException(400, detail=str(e))
     except HTTPException:
@@ -217,6 +229,7 @@ async def get_sun_moon_tides(
         "msl",
         description="Tidal datum reference: 'msl' (Mean Sea Level), 'mllw' (Mean Lower Low Water), or 'lat' (Lowest Astronomical Tide)",
     ),
+    tide_service: FES2022TideService = Depends(get_tide_service),
 ):
     """
     Get combined tide and sun/moon data for a location.
@@ -315,6 +328,7 @@ async def get_location_comparison(
     request: Request,
     location_key: str,
     days: int = Query(3, ge=1, le=7, description="Number of days to compare (1-7)"),
+    tide_service: FES2022TideService = Depends(get_tide_service),
 ):
     """
     Get comparison data for a single location.
@@ -328,7 +342,7 @@ async def get_location_comparison(
     from .comparison import generate_single_location_html
 
     try:
-        html_content = generate_single_location_html(location_key, days)
+        html_content = generate_single_location_html(location_key, days, service=tide_service)
         return HTMLResponse(content=html_content)
     except Exception as e:
         error_msg = html_module.escape(f"Error for {location_key}: {str(e)}")
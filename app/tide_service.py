@@ -25,9 +25,10 @@ References:
 - FES2022 model: LEGOS/CNES global ocean tide atlas
 """
 import os
+import threading
 import numpy as np
 from netCDF4 import Dataset
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Tuple, Optional, Literal
 from enum import Enum
 
@@ -36,7 +37,7 @@ try:
 except ImportError:
     from backports.zoneinfo import ZoneInfo
 
-from timezonefinder import TimezoneFinder
+from .timezones import timezone_name_at
 
 
 class TidalDatum(str, Enum):
@@ -55,6 +56,11 @@ class TidalDatum(str, Enum):
     LAT = "lat"
 
 
+# Degree/radian conversion factors (one multiply instead of an np.radians/np.degrees pass)
+_DEG2RAD = np.pi / 180.0
+_RAD2DEG = 180.0 / np.pi
+_DEG2RAD_F32 = np.float32(_DEG2RAD)
+
 def _julian_centuries(dt: datetime) -> float:
     """
     Calculate Julian centuries from J2000.0 epoch.
@@ -91,11 +97,34 @@ def _julian_centuries(dt: datetime) -> float:
     return (jd - 2451545.0) / 36525.0
 
 
+# J2000.0 epoch (JD 2451545.0) as a NumPy datetime
+_J2000_EPOCH = np.datetime64('2000-01-01T12:00:00', 'us')
+
+
+def _julian_centuries_array(dts: np.ndarray) -> np.ndarray:
+    """
+    Vectorized _julian_centuries for an array of naive UTC datetime64 values.
+
+    datetime64 uses the proleptic Gregorian calendar, so the elapsed time since
+    J2000.0 is equivalent to the Meeus formula (including sub-second precision).
+
+    Args:
+        dts: datetime64 array (UTC)
+
+    Returns:
+        Array of Julian centuries from J2000.0
+    """
+    days = (dts - _J2000_EPOCH) / np.timedelta64(1, 'D')
+    return days / 36525.0
+
+
 def _astronomical_arguments(T: float, hour: float) -> Dict[str, float]:
     """
     Calculate astronomical arguments for tide prediction.
     Based on Meeus formulas and Schureman (1958).
 
+    Works element-wise when T and hour are NumPy arrays.
+
     Args:
         T: Julian centuries from J2000.0
         hour: Hour of day (0-24) in UTC
@@ -108,20 +137,19 @@ def _astronomical_arguments(T: float, hour: float) -> Dict[str, float]:
         - N: Mean longitude of lunar ascending node
         - pp: Mean longitude of solar perigee (perihelion)
     """
+    # Polynomials are evaluated in Horner form (coefficients from highest degree)
+
     # Mean longitude of Moon (s) - Meeus formula 45.1
-    s = (218.3164591 + 481267.88134236 * T
-         - 0.0013268 * T**2 + T**3 / 538841.0 - T**4 / 65194000.0)
+    s = (((-T / 65194000.0 + 1.0 / 538841.0) * T - 0.0013268) * T + 481267.88134236) * T + 218.3164591
 
     # Mean longitude of Sun (h) - Meeus formula 24.2
-    h = 280.46645 + 36000.76983 * T + 0.0003032 * T**2
+    h = (0.0003032 * T + 36000.76983) * T + 280.46645
 
     # Mean longitude of lunar perigee (p) - Meeus
-    p = (83.3532430 + 4069.0137111 * T
-         - 0.0103238 * T**2 - T**3 / 80053.0 + T**4 / 18999000.0)
+    p = (((T / 18999000.0 - 1.0 / 80053.0) * T - 0.0103238) * T + 4069.0137111) * T + 83.3532430
 
     # Mean longitude of lunar ascending node (N) - Meeus formula 45.7
-    N = (125.0445550 - 1934.1361849 * T
-         + 0.0020762 * T**2 + T**3 / 467410.0 - T**4 / 60616000.0)
+    N = (((-T / 60616000.0 + 1.0 / 467410.0) * T + 0.0020762) * T - 1934.1361849) * T + 125.0445550
 
     # Mean longitude of solar perigee (pp) - perihelion
     pp = 282.94 + 1.7192 * T
@@ -136,10 +164,40 @@ def _astronomical_arguments(T: float, hour: float) -> Dict[str, float]:
     return {'s': s, 'h': h, 'p': p, 'N': N, 'pp': pp}
 
 
+def _interpolated_astronomical_arguments(T: np.ndarray, step_hours: float = 1.0) -> Dict[str, np.ndarray]:
+    """
+    Astronomical arguments for an ascending array of times, evaluated on a coarse grid.
+
+    s, h, p, N and pp move by at most ~0.55° per hour, so the polynomials are
+    evaluated every step_hours and linearly interpolated (on unwrapped angles)
+    to the dense samples. Falls back to direct evaluation when the input is
+    already coarse or not sorted.
+
+    Args:
+        T: Julian centuries from J2000.0, ascending
+        step_hours: Spacing of the coarse grid in hours
+
+    Returns:
+        Dictionary of arrays, same keys as _astronomical_arguments
+    """
+    span_hours = (T[-1] - T[0]) * 36525.0 * 24.0
+    num_coarse = max(2, int(np.ceil(span_hours / step_hours)) + 1)
+    if num_coarse >= len(T) or np.any(np.diff(T) < 0):
+        return _astronomical_arguments(T, 0.0)
+
+    T_coarse = np.linspace(T[0], T[-1], num_coarse)
+    coarse = _astronomical_arguments(T_coarse, 0.0)
+    return {
+        key: np.interp(T, T_coarse, np.unwrap(values, period=360.0)) % 360.0
+        for key, values in coarse.items()
+    }
+
+
 def _nodal_corrections(N: float, p: float) -> Dict[str, Tuple[float, float]]:
     """
     Calculate nodal corrections (f and u) for tidal constituents.
-    Based on Schureman (1958) formulas.
+    Based on Schureman (1958) formulas. Works element-wise when N and p are
+    NumPy arrays, in which case f and u are arrays of the same shape.
 
     Args:
         N: Mean longitude of lunar ascending node (degrees)
@@ -151,7 +209,7 @@ def _nodal_corrections(N: float, p: float) -> Dict[str, Tuple[float, float]]:
         - u: Phase correction (degrees)
     """
     # Convert to radians
-    N_rad = np.radians(N)
+    N_rad = N * _DEG2RAD
 
     # Precompute trig functions of N
     cosN = np.cos(N_rad)
@@ -191,9 +249,7 @@ def _nodal_corrections(N: float, p: float) -> Dict[str, Tuple[float, float]]:
     # f_M2 = cos^4(I/2) / 0.9154
     f_m2 = (cosI_half ** 4) / 0.9154
     # u_M2 = 2ξ - 2ν (Schureman Eq 210)
-    u_m2 = np.degrees(2 * xi - 2 * nu) % 360
-    if u_m2 > 180:
-        u_m2 -= 360  # Normalize to -180 to 180
+    u_m2 = np.mod((2 * xi - 2 * nu) * _RAD2DEG + 180.0, 360.0) - 180.0  # Normalize to -180 to 180
     corrections['m2'] = (f_m2, u_m2)
 
     # S2 - Principal solar semidiurnal
@@ -208,16 +264,14 @@ def _nodal_corrections(N: float, p: float) -> Dict[str, Tuple[float, float]]:
     # f_K1 = sqrt(0.8965 * sin^2(2I) + 0.6001 * sin(2I) * cos(ν) + 0.1006)
     f_k1 = np.sqrt(0.8965 * sin2I**2 + 0.6001 * sin2I * cosnu + 0.1006)
     # u_K1 = -ν' (Schureman)
-    u_k1 = -np.degrees(nup)
+    u_k1 = -nup * _RAD2DEG
     corrections['k1'] = (f_k1, u_k1)
 
     # O1 - Principal lunar diurnal - Schureman Eq 227
     # f_O1 = sin(I) * cos^2(I/2) / 0.3800
     f_o1 = sinI * (cosI_half ** 2) / 0.3800
     # u_O1 = 2ξ - ν (Schureman Eq 210)
-    u_o1 = np.degrees(2 * xi - nu) % 360
-    if u_o1 > 180:
-        u_o1 -= 360  # Normalize to -180 to 180
+    u_o1 = np.mod((2 * xi - nu) * _RAD2DEG + 180.0, 360.0) - 180.0  # Normalize to -180 to 180
     corrections['o1'] = (f_o1, u_o1)
 
     # P1 - Principal solar diurnal
@@ -232,7 +286,7 @@ def _nodal_corrections(N: float, p: float) -> Dict[str, Tuple[float, float]]:
     f_k2 = np.sqrt(0.8965 * sin2_I**2 + 0.6001 * sin2_I * cos2nu + 0.1006)
     # u_K2 = -2ν'' (Schureman)
     nupp = np.arctan2(sin2N, 0.5023 + cos2N * 0.1689)
-    u_k2 = -np.degrees(2 * nupp)
+    u_k2 = -2 * nupp * _RAD2DEG
     corrections['k2'] = (f_k2, u_k2)
 
     # Q1 - Larger lunar elliptic diurnal
@@ -272,9 +326,7 @@ def _nodal_corrections(N: float, p: float) -> Dict[str, Tuple[float, float]]:
     # OO1 - Lunar diurnal second order
     # f_OO1 = sin(I) * sin^2(I/2) / 0.0164
     f_oo1 = sinI * (sinI_half ** 2) / 0.0164
-    u_oo1 = np.degrees(-2 * xi - nu) % 360
-    if u_oo1 > 180:
-        u_oo1 -= 360
+    u_oo1 = np.mod((-2 * xi - nu) * _RAD2DEG + 180.0, 360.0) - 180.0
     corrections['oo1'] = (f_oo1, u_oo1)
 
     # M1 - Smaller lunar elliptic diurnal (use K1-like correction)
@@ -295,15 +347,13 @@ def _nodal_corrections(N: float, p: float) -> Dict[str, Tuple[float, float]]:
     # MF - Lunisolar fortnightly
     # f_MF = sin^2(I) / 0.1578
     f_mf = (sinI ** 2) / 0.1578
-    u_mf = np.degrees(-2 * xi) % 360
-    if u_mf > 180:
-        u_mf -= 360
+    u_mf = np.mod(-2 * xi * _RAD2DEG + 180.0, 360.0) - 180.0
     corrections['mf'] = (f_mf, u_mf)
 
     # MM - Lunar monthly
     # f_MM = (2/3 - sin^2(I)) / 0.5021
     f_mm = (2.0/3.0 - sinI**2) / 0.5021
-    corrections['mm'] = (abs(f_mm), 0.0)
+    corrections['mm'] = (np.abs(f_mm), 0.0)
 
     # Default for remaining constituents (solar or negligible nodal effect)
     for const in ['ssa', 'sa', 'msf', 'm8', 's4', 's1',
@@ -314,13 +364,79 @@ def _nodal_corrections(N: float, p: float) -> Dict[str, Tuple[float, float]]:
     return corrections
 
 
+# Diurnal constituents, which need a +180° correction to match the FES2022 phase
+# convention (see FES2022TideService._calculate_harmonic_tide_at_times)
+_DIURNAL_CONSTITUENTS = frozenset({'k1', 'o1', 'p1', 'q1', 'j1', 'm1', 'oo1', 'rho1', 's1'})
+
+# Doodson coefficients for each constituent, one row per name in _DOODSON_NAMES
+# Format: (tau, s, h, p, N, pp, constant)
+# tau = T + h - s (hour angle of mean moon)
+_DOODSON_NAMES = (
+    # Semidiurnal
+    'm2', 's2', 'n2', 'k2', '2n2', 'mu2', 'nu2', 'l2', 't2', 'lambda2', 'eps2',
+    # Diurnal
+    'k1', 'o1', 'p1', 'q1', 'j1', 'm1', 'oo1', 'rho1', 's1',
+    # Shallow water
+    'm4', 'ms4', 'mn4', 'm6', 'm8', 's4', 'm3', 'mks2', 'r2',
+    # Long period
+    'mf', 'mm', 'ssa', 'sa', 'msf', 'msqm', 'mtm',
+)
+_DOODSON_TABLE = np.array([
+    # Semidiurnal
+    (2, 0, 0, 0, 0, 0, 0),      # m2: 2τ
+    (2, 2, -2, 0, 0, 0, 0),     # s2: 2τ + 2s - 2h = 2T
+    (2, -1, 0, 1, 0, 0, 0),     # n2: 2τ - s + p
+    (2, 2, 0, 0, 0, 0, 0),      # k2: 2τ + 2s = 2T + 2h
+    (2, -2, 0, 2, 0, 0, 0),     # 2n2: 2τ - 2s + 2p
+    (2, -2, 2, 0, 0, 0, 0),     # mu2: 2τ - 2s + 2h
+    (2, -1, 2, -1, 0, 0, 0),    # nu2: 2τ - s + 2h - p
+    (2, 1, 0, -1, 0, 0, 180),   # l2: 2τ + s - p + 180°
+    (2, 2, -3, 0, 0, 1, 0),     # t2: 2T - h + pp
+    (2, 1, -2, 1, 0, 0, 180),   # lambda2: 2τ + s - 2h + p + 180°
+    (2, -2, 0, 2, 0, 0, 0),     # eps2: Same as 2N2
+
+    # Diurnal
+    (1, 1, 0, 0, 0, 0, -90),    # k1: τ + s - 90° = T + h - 90°
+    (1, -1, 0, 0, 0, 0, 90),    # o1: τ - s + 90°
+    (1, 1, -2, 0, 0, 0, 90),    # p1: τ + s - 2h + 90° = T - h + 90°
+    (1, -2, 0, 1, 0, 0, 90),    # q1: τ - 2s + p + 90°
+    (1, 2, 0, -1, 0, 0, -90),   # j1: τ + 2s - p - 90°
+    (1, 0, 0, 0, 0, 0, -90),    # m1: τ - 90°
+    (1, 2, 0, 0, 0, 0, -90),    # oo1: τ + 2s - 90°
+    (1, -2, 2, -1, 0, 0, 90),   # rho1: τ - 2s + 2h - p + 90°
+    (1, 1, -1, 0, 0, 0, 0),     # s1: T
+
+    # Shallow water
+    (4, 0, 0, 0, 0, 0, 0),      # m4: 4τ
+    (4, 2, -2, 0, 0, 0, 0),     # ms4: 4τ + 2s - 2h
+    (4, -1, 0, 1, 0, 0, 0),     # mn4: 4τ - s + p
+    (6, 0, 0, 0, 0, 0, 0),      # m6: 6τ
+    (8, 0, 0, 0, 0, 0, 0),      # m8: 8τ
+    (4, 4, -4, 0, 0, 0, 0),     # s4: 4T
+    (3, 0, 0, 0, 0, 0, 0),      # m3: 3τ
+    (2, 2, 0, 0, 0, 0, 0),      # mks2: Same as K2
+    (2, 2, -1, 0, 0, -1, 0),    # r2: 2T + h - pp
+
+    # Long period
+    (0, 2, 0, 0, 0, 0, 0),      # mf: 2s
+    (0, 1, 0, -1, 0, 0, 0),     # mm: s - p
+    (0, 0, 2, 0, 0, 0, 0),      # ssa: 2h
+    (0, 0, 1, 0, 0, 0, 0),      # sa: h
+    (0, 2, -2, 0, 0, 0, 0),     # msf: 2s - 2h
+    (0, 2, -2, 0, 0, 0, 0),     # msqm: 2s - 2h
+    (0, 3, 0, -1, 0, 0, 0),     # mtm: 3s - p
+], dtype=np.float64)
+_DOODSON_IDX = {name: i for i, name in enumerate(_DOODSON_NAMES)}
+
+
 def _equilibrium_argument(const: str, s: float, h: float, p: float, N: float, pp: float, T: float) -> float:
     """
     Calculate equilibrium argument (V0) for a tidal constituent.
     Based on Doodson numbers and Schureman conventions.
 
     The equilibrium argument V0 is the phase of the tide-generating force
-    at Greenwich at time T=0 of the prediction period.
+    at Greenwich at time T=0 of the prediction period. The astronomical
+    arguments may be NumPy arrays to evaluate many instants at once.
 
     Args:
         const: Constituent name (lowercase)
@@ -334,68 +450,149 @@ def _equilibrium_argument(const: str, s: float, h: float, p: float, N: float, pp
     Returns:
         V0 in degrees
     """
-    # Doodson coefficients for each constituent
-    # Format: (tau, s, h, p, N, pp, constant)
-    # tau = T + h - s (hour angle of mean moon)
-
-    tau = T + h - s  # Mean lunar time
-
-    doodson = {
-        # Semidiurnal
-        'm2':  (2, 0, 0, 0, 0, 0, 0),      # 2τ
-        's2':  (2, 2, -2, 0, 0, 0, 0),     # 2τ + 2s - 2h = 2T
-        'n2':  (2, -1, 0, 1, 0, 0, 0),     # 2τ - s + p
-        'k2':  (2, 2, 0, 0, 0, 0, 0),      # 2τ + 2s = 2T + 2h
-        '2n2': (2, -2, 0, 2, 0, 0, 0),     # 2τ - 2s + 2p
-        'mu2': (2, -2, 2, 0, 0, 0, 0),     # 2τ - 2s + 2h
-        'nu2': (2, -1, 2, -1, 0, 0, 0),    # 2τ - s + 2h - p
-        'l2':  (2, 1, 0, -1, 0, 0, 180),   # 2τ + s - p + 180°
-        't2':  (2, 2, -3, 0, 0, 1, 0),     # 2T - h + pp
-        'lambda2': (2, 1, -2, 1, 0, 0, 180), # 2τ + s - 2h + p + 180°
-        'eps2': (2, -2, 0, 2, 0, 0, 0),    # Same as 2N2
-
-        # Diurnal
-        'k1':  (1, 1, 0, 0, 0, 0, -90),    # τ + s - 90° = T + h - 90°
-        'o1':  (1, -1, 0, 0, 0, 0, 90),    # τ - s + 90°
-        'p1':  (1, 1, -2, 0, 0, 0, 90),    # τ + s - 2h + 90° = T - h + 90°
-        'q1':  (1, -2, 0, 1, 0, 0, 90),    # τ - 2s + p + 90°
-        'j1':  (1, 2, 0, -1, 0, 0, -90),   # τ + 2s - p - 90°
-        'm1':  (1, 0, 0, 0, 0, 0, -90),    # τ - 90°
-        'oo1': (1, 2, 0, 0, 0, 0, -90),    # τ + 2s - 90°
-        'rho1': (1, -2, 2, -1, 0, 0, 90),  # τ - 2s + 2h - p + 90°
-        's1':  (1, 1, -1, 0, 0, 0, 0),     # T
-
-        # Shallow water
-        'm4':  (4, 0, 0, 0, 0, 0, 0),      # 4τ
-        'ms4': (4, 2, -2, 0, 0, 0, 0),     # 4τ + 2s - 2h
-        'mn4': (4, -1, 0, 1, 0, 0, 0),     # 4τ - s + p
-        'm6':  (6, 0, 0, 0, 0, 0, 0),      # 6τ
-        'm8':  (8, 0, 0, 0, 0, 0, 0),      # 8τ
-        's4':  (4, 4, -4, 0, 0, 0, 0),     # 4T
-        'm3':  (3, 0, 0, 0, 0, 0, 0),      # 3τ
-        'mks2': (2, 2, 0, 0, 0, 0, 0),     # Same as K2
-        'r2':  (2, 2, -1, 0, 0, -1, 0),    # 2T + h - pp
-
-        # Long period
-        'mf':  (0, 2, 0, 0, 0, 0, 0),      # 2s
-        'mm':  (0, 1, 0, -1, 0, 0, 0),     # s - p
-        'ssa': (0, 0, 2, 0, 0, 0, 0),      # 2h
-        'sa':  (0, 0, 1, 0, 0, 0, 0),      # h
-        'msf': (0, 2, -2, 0, 0, 0, 0),     # 2s - 2h
-        'msqm': (0, 2, -2, 0, 0, 0, 0),    # 2s - 2h
-        'mtm': (0, 3, 0, -1, 0, 0, 0),     # 3s - p
-    }
+    tau = T + h - s  # Mean lunar time (see _DOODSON_TABLE)
 
-    if const not in doodson:
+    idx = _DOODSON_IDX.get(const)
+    if idx is None:
         return 0.0
 
-    coef = doodson[const]
+    coef = _DOODSON_TABLE[idx]
     V0 = (coef[0] * tau + coef[1] * s + coef[2] * h +
           coef[3] * p + coef[4] * N + coef[5] * pp + coef[6])
 
     return V0 % 360.0
 
 
+def _doodson_matrix(names) -> np.ndarray:
+    """
+    Stack the Doodson coefficients of the given constituents into a (K, 7) array.
+
+    Constituents without Doodson numbers get a zero row (V = 0), matching
+    _equilibrium_argument.
+    """
+    matrix = np.zeros((len(names), 7))
+    for k, name in enumerate(names):
+        idx = _DOODSON_IDX.get(name)
+        if idx is not None:
+            matrix[k] = _DOODSON_TABLE[idx]
+    return matrix
+
+
+# Per-thread scratch arrays for the (N, K) intermediates of _harmonic_kernel
+_KERNEL_SCRATCH = threading.local()
+
+
+def _kernel_scratch(name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """
+    Get this thread's scratch array for name, reshaped to shape.
+
+    The backing buffer is reused across calls and only reallocated when a longer
+    one is needed. Its contents are overwritten by the thread's next kernel call.
+    """
+    size = int(np.prod(shape))
+    buffer = getattr(_KERNEL_SCRATCH, name, None)
+    if buffer is None or buffer.size < size:
+        buffer = np.empty(size, dtype=dtype)
+        setattr(_KERNEL_SCRATCH, name, buffer)
+    return buffer[:size].reshape(shape)
+
+
+def _harmonic_kernel(
+    astro_args: np.ndarray,
+    doodson: np.ndarray,
+    amplitudes: np.ndarray,
+    kappas: np.ndarray,
+    f: np.ndarray,
+    u: np.ndarray
+) -> np.ndarray:
+    """
+    Evaluate h(t) = Σ f * H * cos(V(t) + u - G) for all samples and constituents at once.
+
+    The sum is evaluated directly rather than through an inverse FFT: constituent
+    frequencies don't fall on FFT bins, and with ~24 constituents the direct
+    O(N * K) product is already a single BLAS call.
+
+    Args:
+        astro_args: (N, 7) array of (tau, s, h, p, N, pp, 1) per sample, in degrees
+        doodson: (K, 7) Doodson coefficients (see _doodson_matrix)
+        amplitudes: (K,) constituent amplitudes in meters
+        kappas: (K,) Greenwich phase lags in degrees, FES2022 correction applied
+        f: (K,) or (N, K) nodal amplitude factors
+        u: (K,) or (N, K) nodal phase corrections in degrees
+
+    Returns:
+        (N,) array of tide heights in meters
+    """
+    shape = (len(astro_args), len(doodson))
+
+    # Equilibrium arguments for every (sample, constituent) pair: V = A @ D^T. The
+    # (N, K) intermediates (several MB for a 30-day curve at 3-minute resolution)
+    # are written into per-thread scratch arrays instead of being allocated per call.
+    V = np.matmul(astro_args, doodson.T, out=_kernel_scratch('V', shape, np.float64))
+
+    # Phases are reduced to 0-360° in float64, then the cosines and the weighted sum
+    # run in float32 (~1e-6 m error over ~24 terms, far below the cm precision of
+    # FES2022). The sum over constituents is a single BLAS matrix-vector product.
+    V += u
+    V -= kappas
+    np.mod(V, 360.0, out=V)
+    phase = _kernel_scratch('phase', shape, np.float32)
+    np.copyto(phase, V, casting='same_kind')
+    phase *= _DEG2RAD_F32
+    np.cos(phase, out=phase)
+    heights = np.matmul(
+        phase, (f * amplitudes).astype(np.float32), out=_kernel_scratch('heights', shape[:1], np.float32)
+    )
+    # The result is a new array, so callers may keep it across kernel calls
+    return heights.astype(np.float64)
+
+
+def _grid_bracket(coords: np.ndarray, step: float, uniform: bool, value: float) -> Tuple[int, float]:
+    """
+    Lower index of the grid cell containing value and the fractional position in it.
+
+    Uses closed-form index math on uniform ascending grids, and a binary search
+    on other ascending grids. Values outside the grid are clamped to its edge.
+
+    Returns:
+        Tuple of (i0, frac) with 0 <= i0 <= len(coords) - 2 and 0 <= frac <= 1
+    """
+    n = len(coords)
+    if n < 2:
+        return 0, 0.0
+    if uniform:
+        position = (value - coords[0]) / step
+        i0 = int(np.floor(position))
+    else:
+        i0 = int(np.searchsorted(coords, value)) - 1
+    i0 = max(0, min(n - 2, i0))
+    if uniform:
+        frac = position - i0
+    else:
+        frac = (value - coords[i0]) / (coords[i0 + 1] - coords[i0])
+    return i0, min(1.0, max(0.0, float(frac)))
+
+def _utc_time_axis(start_time: datetime, time_offsets_hours: np.ndarray) -> np.ndarray:
+    """
+    Build a datetime64 array of UTC sample times from a start time and hour offsets.
+
+    Args:
+        start_time: Timezone-aware start of the period
+        time_offsets_hours: Hours since start_time for each sample
+
+    Returns:
+        datetime64[us] array of naive UTC times
+    """
+    start_utc = start_time.astimezone(timezone.utc).replace(tzinfo=None)
+    offsets = np.round(time_offsets_hours * 3600e6).astype('timedelta64[us]')
+    return np.datetime64(start_utc, 'us') + offsets
+
+
+def _local_time(start_time: datetime, offset_hours: float) -> datetime:
+    """Datetime offset_hours of elapsed time after start_time, in start_time's timezone."""
+    return (start_time.astimezone(timezone.utc) + timedelta(hours=offset_hours)).astimezone(start_time.tzinfo)
+
+
 class FES2022TideService:
     """
     Service for predicting tides using FES2022 (Finite Element Solution) global ocean tide model.
@@ -457,23 +654,51 @@ class FES2022TideService:
         'msqm': 1.0158958,  # Lunisolar synodic fortnightly
         'mtm': 1.0980331,   # Lunisolar fortnightly
     }
+
+    # Constituents synthesized, in the fixed order shared by the per-location arrays
+    # and the per-time-axis nodal factors (see _cache_constituents and _time_factors)
+    PREDICTED_CONSTITUENTS = tuple(filter(CONSTITUENTS.__contains__, CONSTITUENTS_TO_USE))
+
+    # Maximum number of locations kept in the per-location constituent cache
+    CONSTITUENT_CACHE_SIZE = 1024
+
+    # Maximum number of time axes kept in the time-factor cache (see _time_factors)
+    TIME_FACTOR_CACHE_SIZE = 16
+
+    # Maximum number of datum offsets kept in the datum offset cache (see _calculate_datum_offset)
+    DATUM_OFFSET_CACHE_SIZE = 2048
+
+    # HDF5 chunk cache size per constituent data variable (see _get_grid_info)
+    CHUNK_CACHE_BYTES = 32 * 1024 * 1024
     
-    def __init__(self, data_path: str = './'):
+    def __init__(self, data_path: str = './', grid_cache_dir: Optional[str] = None):
         """
         Initialize the FES2022 Tide Service.
 
         Args:
             data_path: Path to directory containing 'ocean_tide_extrapolated' folder
+            grid_cache_dir: Optional directory for memory-mapped copies of the
+                            constituent grids (see _cached_grid_variables). Needs
+                            about 130 MB of disk per constituent. Disabled if None.
         """
         self.data_path = data_path
         self.ocean_path = os.path.join(data_path, 'ocean_tide_extrapolated')
+        # Optional copy rechunked for point queries (see scripts/rechunk_fes.py)
+        self.rechunked_path = os.path.join(data_path, 'ocean_tide_extrapolated_rechunked')
+        self.grid_cache_dir = grid_cache_dir
 
-        # Cache for loaded NetCDF datasets
+        # Cache for loaded NetCDF datasets and their grid information (see _get_grid_info)
         self._datasets = {}
         self._grids = {}
 
-        # Cache TimezoneFinder instance (loads data on first use)
-        self._tz_finder = TimezoneFinder()
+        # Cache of per-location constituent arrays (see _load_constituents)
+        self._constituents_cache = {}
+
+        # Cache of datum offsets per rounded location, datum and day (see _calculate_datum_offset)
+        self._datum_offsets = {}
+
+        # Cache of location-independent synthesis terms per time axis (see _time_factors)
+        self._time_factors_cache = {}
 
         # Verify data directories exist
         if not os.path.exists(self.ocean_path):
@@ -492,7 +717,7 @@ class FES2022TideService:
             ZoneInfo object for the timezone
         """
         if timezone_str is None:
-            timezone_str = self._tz_finder.timezone_at(lat=lat, lng=lon)
+            timezone_str = timezone_name_at(lat, lon)
             if timezone_str is None:
                 timezone_str = 'UTC'
         try:
@@ -500,30 +725,110 @@ class FES2022TideService:
         except (ValueError, KeyError):
             return ZoneInfo('UTC')
 
-    def _load_constituents(self, lat: float, lon: float) -> Dict[str, Tuple[float, float]]:
+    def _load_constituents(self, lat: float, lon: float) -> Dict[str, np.ndarray]:
         """
         Load tidal constituent data for a location.
 
+        Results are cached per location as parallel float32 arrays (structure of
+        arrays), so repeated predictions for the same spot skip the NetCDF lookups.
+
         Args:
             lat: Latitude in degrees
             lon: Longitude in degrees
 
         Returns:
-            Dictionary mapping constituent names to (amplitude, phase) tuples
+            Dictionary of parallel arrays for the significant constituents:
+            - names: Tuple of constituent names
+            - amplitudes: Amplitudes in meters (float32)
+            - phases: Greenwich phase lags in degrees (float32)
+            - diurnal: Boolean mask of diurnal constituents
+            - kappas: Phases with the FES2022 diurnal +180° correction applied
+            - doodson: (K, 7) Doodson coefficients (see _doodson_matrix)
+            - index: Positions of the constituents in PREDICTED_CONSTITUENTS
         """
-        constituents = {}
-        for const in self.CONSTITUENTS_TO_USE:
-            amp, phase = self.get_constituent_data(const, lat, lon)
+        key = (lat, lon)
+        cached = self._constituents_cache.get(key)
+        if cached is not None:
+            return cached
+
+        values = [
+            (const, *self.get_constituent_data(const, lat, lon))
+            for const in self.PREDICTED_CONSTITUENTS
+        ]
+        return self._cache_constituents(key, values)
+
+    def _cache_constituents(self, key: Tuple[float, float], values: List[Tuple[str, float, float]]) -> Dict[str, np.ndarray]:
+        """
+        Build the constituent arrays for a location and store them in the cache.
+
+        Args:
+            key: (lat, lon) cache key
+            values: (name, amplitude, phase) for each constituent read at the location
+
+        Returns:
+            Constituent arrays (see _load_constituents)
+        """
+        names = []
+        amplitudes = []
+        phases = []
+        for const, amp, phase in values:
             if amp > 0.001:  # Only include significant constituents
-                constituents[const] = (amp, phase)
+                names.append(const)
+                amplitudes.append(amp)
+                phases.append(phase)
+
+        phases = np.array(phases, dtype=np.float32)
+        diurnal = np.array([name in _DIURNAL_CONSTITUENTS for name in names], dtype=bool)
+        constituents = {
+            'names': tuple(names),
+            'amplitudes': np.array(amplitudes, dtype=np.float32),
+            'phases': phases,
+            'diurnal': diurnal,
+            # FES2022 phase convention correction folded in once: diurnal +180°
+            'kappas': phases + 180.0 * diurnal,
+            'doodson': _doodson_matrix(names),
+            'index': np.array([self.PREDICTED_CONSTITUENTS.index(name) for name in names], dtype=np.intp),
+        }
+
+        # Evict the oldest entry so arbitrary coordinates can't grow the cache without bound
+        if len(self._constituents_cache) >= self.CONSTITUENT_CACHE_SIZE:
+            self._constituents_cache.pop(next(iter(self._constituents_cache)))
+        self._constituents_cache[key] = constituents
+
         return constituents
-    
+
+    def preload_constituents(self, coords: List[Tuple[float, float]]) -> None:
+        """
+        Load constituent data for many locations into the per-location cache.
+
+        Reads constituent-major (every location for one NetCDF file, then the
+        next file), so each file's chunk cache stays warm instead of jumping
+        between files for every location. Useful at startup or in test fixtures
+        for a known list of spots.
+
+        Args:
+            coords: List of (lat, lon) tuples in degrees
+        """
+        pending = list(dict.fromkeys(
+            (lat, lon) for lat, lon in coords if (lat, lon) not in self._constituents_cache
+        ))
+        values = {key: [] for key in pending}
+        for const in self.PREDICTED_CONSTITUENTS:
+            for lat, lon in pending:
+                values[(lat, lon)].append((const, *self.get_constituent_data(const, lat, lon)))
+
+        for key in pending:
+            self._cache_constituents(key, values[key])
+
     def _get_dataset(self, constituent: str) -> Optional[Dataset]:
         """Load and cache NetCDF dataset for a constituent."""
         if constituent in self._datasets:
             return self._datasets[constituent]
 
-        ocean_file = os.path.join(self.ocean_path, f"{constituent}_fes2022.nc")
+        # Prefer the rechunked copy when it has been generated
+        ocean_file = os.path.join(self.rechunked_path, f"{constituent}_fes2022.nc")
+        if not os.path.exists(ocean_file):
+            ocean_file = os.path.join(self.ocean_path, f"{constituent}_fes2022.nc")
         if os.path.exists(ocean_file):
             try:
                 ds = Dataset(ocean_file, 'r')
@@ -535,23 +840,159 @@ class FES2022TideService:
 
         return None
     
-    def _get_grid_info(self, dataset: Dataset) -> Dict:
-        """Extract grid information from NetCDF dataset."""
+    def open_datasets(self) -> int:
+        """
+        Open every constituent file and resolve its grid up front.
+
+        Called at application startup so the first request doesn't pay for
+        opening the NetCDF files. Files are opened one after another: the
+        netCDF-C/HDF5 libraries are not thread-safe, so concurrent opens from a
+        thread pool could corrupt library state.
+
+        Returns:
+            Number of constituent datasets available
+        """
+        opened = 0
+        for const in self.CONSTITUENTS_TO_USE:
+            dataset = self._get_dataset(const)
+            if dataset is not None:
+                self._get_grid_info(const, dataset)
+                opened += 1
+        return opened
+
+    def close(self) -> None:
+        """
+        Close every open constituent dataset.
+
+        Grid information holds the datasets' variable handles, so it is dropped
+        too; the service reopens files on the next query if used again.
+        """
+        for dataset in self._datasets.values():
+            try:
+                dataset.close()
+            except RuntimeError:
+                # Already closed
+                pass
+        self._datasets.clear()
+        self._grids.clear()
+
+    def _get_grid_info(self, constituent: str, dataset: Dataset) -> Optional[Dict]:
+        """
+        Extract and cache grid information for a constituent's NetCDF dataset.
+
+        The coordinate arrays, longitude convention and data variable handles are
+        read once per constituent and kept in self._grids. The amplitude/phase grids
+        themselves stay on disk (about 130 MB per constituent at 1/30°); only the
+        cells needed for a location are read, and _load_constituents caches the
+        result per location.
+        """
+        if constituent in self._grids:
+            return self._grids[constituent]
+
         # FES2022 files typically have 'lat' and 'lon' variables
-        if 'lat' in dataset.variables and 'lon' in dataset.variables:
-            lats = dataset.variables['lat'][:]
-            lons = dataset.variables['lon'][:]
-            return {
-                'lats': np.array(lats),
-                'lons': np.array(lons),
-                'lat_min': float(np.min(lats)),
-                'lat_max': float(np.max(lats)),
-                'lon_min': float(np.min(lons)),
-                'lon_max': float(np.max(lons)),
-            }
-        return None
+        if 'lat' not in dataset.variables or 'lon' not in dataset.variables:
+            return None
+
+        lats = np.array(dataset.variables['lat'][:])
+        lons = np.array(dataset.variables['lon'][:])
+
+        # FES2022 files may use 'amplitude'/'phase' or 'Re'/'Im' (real/imaginary)
+        if 'amplitude' in dataset.variables and 'phase' in dataset.variables:
+            variables = (dataset.variables['amplitude'], dataset.variables['phase'])
+            polar = True
+        elif 'Re' in dataset.variables and 'Im' in dataset.variables:
+            variables = (dataset.variables['Re'], dataset.variables['Im'])
+            polar = False
+        else:
+            variables = None
+            polar = True
+
+        # Enlarge the HDF5 chunk cache of the data variables so repeated point reads
+        # near earlier ones are served from decompressed chunks in memory
+        if variables is not None:
+            for var in variables:
+                try:
+                    var.set_var_chunk_cache(
+                        size=self.CHUNK_CACHE_BYTES, nelems=10007, preemption=0.75
+                    )
+                except (AttributeError, RuntimeError):
+                    # Not an HDF5-backed (netCDF-4) variable
+                    pass
+
+        # Grid spacing; FES2022 grids are uniform, so nearest indices are closed-form
+        dlat = float(lats[-1] - lats[0]) / (len(lats) - 1) if len(lats) > 1 else 0.0
+        dlon = float(lons[-1] - lons[0]) / (len(lons) - 1) if len(lons) > 1 else 0.0
+
+        grid_info = {
+            'lats': lats,
+            'lons': lons,
+            'lat_min': float(np.min(lats)),
+            'lat_max': float(np.max(lats)),
+            'lon_min': float(np.min(lons)),
+            'lon_max': float(np.max(lons)),
+            'dlat': dlat,
+            'dlon': dlon,
+            'lat_uniform': dlat > 0 and bool(np.allclose(np.diff(lats), dlat)),
+            'lon_uniform': dlon > 0 and bool(np.allclose(np.diff(lons), dlon)),
+            # Global grids without a duplicated seam column wrap from the last column to the first
+            'lon_periodic': dlon > 0 and bool(np.isclose(float(lons[-1] - lons[0]) + dlon, 360.0)),
+            'variables': variables,
+            'polar': polar,
+        }
+
+        # Prefer memory-mapped float32 copies of the grids when a cache directory is set
+        if variables is not None:
+            cached = self._cached_grid_variables(constituent, variables, (len(lats), len(lons)))
+            if cached is not None:
+                grid_info['variables'] = cached
+
+        self._grids[constituent] = grid_info
+        return grid_info
+
+    def _cached_grid_variables(
+        self,
+        constituent: str,
+        variables: Tuple,
+        shape: Tuple[int, int]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Memory-mapped float32 copies of a constituent's two data grids.
+
+        On first use the NetCDF variables are decoded once and written as .npy
+        files (missing values as NaN) to grid_cache_dir; later loads, including
+        in other processes, map those files instead of decompressing the NetCDF
+        data. File names include the NetCDF modification time, so replacing a
+        data file invalidates its cache.
+
+        Returns:
+            Tuple of two (lat, lon) arrays, or None if caching is disabled or fails
+        """
+        if self.grid_cache_dir is None:
+            return None
+
+        ocean_file = os.path.join(self.ocean_path, f"{constituent}_fes2022.nc")
+        try:
+            mtime = int(os.path.getmtime(ocean_file))
+            paths = [
+                os.path.join(self.grid_cache_dir, f"{constituent}_{mtime}_{index}.npy")
+                for index in range(len(variables))
+            ]
+
+            if not all(os.path.exists(path) for path in paths):
+                os.makedirs(self.grid_cache_dir, exist_ok=True)
+                for var, path in zip(variables, paths):
+                    data = np.ma.filled(np.ma.asarray(var[:]).astype(np.float32), np.nan)
+                    tmp_path = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'wb') as f:
+                        np.save(f, data.reshape(shape))
+                    os.replace(tmp_path, path)
+
+            return tuple(np.load(path, mmap_mode='r') for path in paths)
+        except (OSError, ValueError):
+            # Read-only or full cache directory, unexpected grid shape, etc.
+            return None
     
-    def _interpolate_value(self, dataset: Dataset, lat: float, lon: float) -> Tuple[float, float]:
+    def _interpolate_value(self, constituent: str, dataset: Dataset, lat: float, lon: float) -> Tuple[float, float]:
         """
         Interpolate amplitude and phase for given lat/lon from NetCDF dataset.
         
@@ -559,8 +1000,8 @@ class FES2022TideService:
             Tuple of (amplitude, phase) in meters and degrees
         """
         # Check the longitude format of the data file
-        grid_info = self._get_grid_info(dataset)
-        if not grid_info:
+        grid_info = self._get_grid_info(constituent, dataset)
+        if not grid_info or grid_info['variables'] is None:
             return 0.0, 0.0
 
         # If data uses 0-360 format, convert negative longitudes
@@ -578,52 +1019,67 @@ class FES2022TideService:
         lats = grid_info['lats']
         lons = grid_info['lons']
         
-        # Find nearest grid point (simple nearest neighbor for now)
-        lat_idx = np.argmin(np.abs(lats - lat))
-        lon_idx = np.argmin(np.abs(lons - lon))
-        
-        # Try different variable name conventions
-        amplitude = 0.0
-        phase = 0.0
-        
-        # FES2022 files may use 'amplitude'/'phase' or 'Re'/'Im' (real/imaginary)
-        if 'amplitude' in dataset.variables and 'phase' in dataset.variables:
-            amp_var = dataset.variables['amplitude']
-            phase_var = dataset.variables['phase']
-            
-            # Handle 2D arrays (lat, lon)
-            if len(amp_var.shape) == 2:
-                amplitude = float(amp_var[lat_idx, lon_idx])
-                phase = float(phase_var[lat_idx, lon_idx])
-            elif len(amp_var.shape) == 1:
-                # 1D array, need to calculate index
-                idx = lat_idx * len(lons) + lon_idx
-                amplitude = float(amp_var[idx])
-                phase = float(phase_var[idx])
-        
-        elif 'Re' in dataset.variables and 'Im' in dataset.variables:
-            # Real and imaginary parts - convert to amplitude and phase
-            re_var = dataset.variables['Re']
-            im_var = dataset.variables['Im']
-            
-            if len(re_var.shape) == 2:
-                re = float(re_var[lat_idx, lon_idx])
-                im = float(im_var[lat_idx, lon_idx])
-            elif len(re_var.shape) == 1:
-                idx = lat_idx * len(lons) + lon_idx
-                re = float(re_var[idx])
-                im = float(im_var[idx])
+        # Bilinear interpolation between the four surrounding grid points
+        i0, di = _grid_bracket(lats, grid_info['dlat'], grid_info['lat_uniform'], lat)
+        if grid_info['lon_periodic'] and not lons[0] <= lon <= lons[-1]:
+            # Between the last and first columns of a global grid: wrap around the seam
+            j0, j1 = len(lons) - 1, 0
+            dj = ((lon - lons[-1]) % 360.0) / grid_info['dlon']
+            dj = min(1.0, max(0.0, dj))
+        else:
+            j0, dj = _grid_bracket(lons, grid_info['dlon'], grid_info['lon_uniform'], lon)
+            j1 = j0 + 1
+
+        first_var, second_var = grid_info['variables']
+
+        # Handle 2D arrays (lat, lon)
+        if len(first_var.shape) == 2:
+            if j1 == j0 + 1:
+                first = first_var[i0:i0 + 2, j0:j0 + 2]
+                second = second_var[i0:i0 + 2, j0:j0 + 2]
             else:
-                return 0.0, 0.0
-            
-            # Convert to amplitude and phase
-            amplitude = np.sqrt(re**2 + im**2)
-            phase = np.degrees(np.arctan2(im, re))
-        
-        # Handle missing values
-        if np.isnan(amplitude) or np.isnan(phase) or amplitude < 0:
+                first = np.ma.concatenate(
+                    [first_var[i0:i0 + 2, j0:j0 + 1], first_var[i0:i0 + 2, j1:j1 + 1]], axis=1
+                )
+                second = np.ma.concatenate(
+                    [second_var[i0:i0 + 2, j0:j0 + 1], second_var[i0:i0 + 2, j1:j1 + 1]], axis=1
+                )
+            first = np.ma.filled(np.ma.asarray(first).astype(np.float64), np.nan)
+            second = np.ma.filled(np.ma.asarray(second).astype(np.float64), np.nan)
+        elif len(first_var.shape) == 1:
+            # 1D array, need to calculate indices
+            idx = [i * len(lons) + j for i in (i0, i0 + 1) for j in (j0, j1)]
+            first = np.array([first_var[k] for k in idx], dtype=np.float64).reshape(2, 2)
+            second = np.array([second_var[k] for k in idx], dtype=np.float64).reshape(2, 2)
+        else:
             return 0.0, 0.0
 
+        if grid_info['polar']:
+            # Interpolate in Re/Im space to avoid the 360° phase wrap
+            amp_grid = np.where(first < 0, np.nan, first)
+            re = amp_grid * np.cos(second * _DEG2RAD)
+            im = amp_grid * np.sin(second * _DEG2RAD)
+        else:
+            re, im = first, second
+
+        # Handle missing values: land corners are left out of the weighted sum
+        valid = ~(np.isnan(re) | np.isnan(im))
+        if not valid.any():
+            return 0.0, 0.0
+
+        weights = np.array([[(1 - di) * (1 - dj), (1 - di) * dj],
+                            [di * (1 - dj), di * dj]]) * valid
+        if weights.sum() <= 0:
+            # Only zero-weight corners have data
+            weights = valid.astype(np.float64)
+        weights /= weights.sum()
+        re_interp = float(np.sum(weights * np.where(valid, re, 0.0)))
+        im_interp = float(np.sum(weights * np.where(valid, im, 0.0)))
+
+        # Convert to amplitude and phase
+        amplitude = float(np.hypot(re_interp, im_interp))
+        phase = float((np.arctan2(im_interp, re_interp) * _RAD2DEG) % 360.0)
+
         # FES2022 stores amplitude in centimeters - convert to meters
         amplitude = amplitude / 100.0
 
@@ -647,12 +1103,85 @@ class FES2022TideService:
         if dataset is None:
             return 0.0, 0.0
         
-        return self._interpolate_value(dataset, lat, lon)
+        return self._interpolate_value(constituent, dataset, lat, lon)
     
+    def _time_factors(self, datetimes) -> Dict:
+        """
+        Compute the location-independent terms of the harmonic synthesis.
+
+        Results are cached per time axis (first sample, last sample, count), so
+        repeated requests for the same day - including the MSL prediction behind
+        datum offsets - reuse them.
+
+        Args:
+            datetimes: List of datetime objects (UTC or timezone-aware), or a
+                       datetime64 array of UTC times (see _utc_time_axis)
+
+        Returns:
+            Dictionary with:
+            - astro_args: (N, 7) array of (tau, s, h, p, N, pp, 1) per sample
+            - nodal: Nodal corrections at the middle of the period (see _nodal_corrections)
+            - f, u: Nodal factors and phase corrections as arrays in PREDICTED_CONSTITUENTS order
+        """
+        if isinstance(datetimes, np.ndarray) and np.issubdtype(datetimes.dtype, np.datetime64):
+            times = datetimes.astype('datetime64[us]')
+        else:
+            # Convert to naive UTC once
+            datetimes_utc = [
+                dt.replace(tzinfo=None) - dt.utcoffset() if dt.tzinfo is not None else dt
+                for dt in datetimes
+            ]
+            times = np.array(datetimes_utc, dtype='datetime64[us]')
+
+        key = (int(times[0].astype(np.int64)), int(times[-1].astype(np.int64)), len(times))
+        cached = self._time_factors_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Julian centuries and UTC hour of day for every sample
+        T = _julian_centuries_array(times)
+        hours = (times - times.astype('datetime64[D]')) / np.timedelta64(1, 'h')
+
+        # Astronomical arguments for the whole time axis (slowly varying, so they are
+        # evaluated hourly and interpolated; tau carries the fast hour-angle term)
+        astro = _interpolated_astronomical_arguments(T)
+
+        # Nodal corrections drift by ~0.002° per hour (18.6-year cycle), so they are
+        # evaluated once at the middle of the prediction period and reused
+        T_mid = 0.5 * (T[0] + T[-1])
+        astro_mid = _astronomical_arguments(T_mid, 0.0)
+        nodal = _nodal_corrections(astro_mid['N'], astro_mid['p'])
+
+        # Hour angle in degrees (15° per hour from midnight)
+        hour_angle = hours * 15.0
+
+        # Astronomical arguments per sample: tau = T + h - s (T = Greenwich hour angle of mean sun)
+        tau = hour_angle + astro['h'] - astro['s']
+        astro_args = np.column_stack([
+            tau, astro['s'], astro['h'], astro['p'], astro['N'], astro['pp'],
+            np.ones(len(times))
+        ])
+
+        # Nodal terms as arrays in the fixed constituent order, so each location
+        # selects its own with one fancy index instead of per-name dict lookups
+        f, u = np.array(
+            [nodal.get(name, (1.0, 0.0)) for name in self.PREDICTED_CONSTITUENTS], dtype=np.float64
+        ).T
+
+        time_factors = {'astro_args': astro_args, 'nodal': nodal, 'f': f, 'u': u}
+
+        # Evict the oldest entry; each one holds a (N, 7) array
+        if len(self._time_factors_cache) >= self.TIME_FACTOR_CACHE_SIZE:
+            self._time_factors_cache.pop(next(iter(self._time_factors_cache)))
+        self._time_factors_cache[key] = time_factors
+
+        return time_factors
+
     def _calculate_harmonic_tide_at_times(
         self,
-        datetimes: List[datetime],
-        constituents: Dict[str, Tuple[float, float]]
+        datetimes,
+        constituents: Dict[str, np.ndarray],
+        time_factors: Optional[Dict] = None
     ) -> np.ndarray:
         """
         Calculate tide height using standard harmonic analysis formula.
@@ -669,70 +1198,39 @@ class FES2022TideService:
         through the Doodson multipliers on τ (mean lunar time), so we don't add ω*t separately.
 
         Args:
-            datetimes: List of datetime objects (UTC or timezone-aware)
-            constituents: Dict mapping constituent names to (amplitude, phase) tuples
+            datetimes: List of datetime objects (UTC or timezone-aware), or a
+                       datetime64 array of UTC times (see _utc_time_axis)
+            constituents: Constituent arrays for the location (see _load_constituents)
+            time_factors: Optional result of _time_factors for these datetimes, to
+                          share the time-dependent terms between locations
 
         Returns:
             Array of tide heights in meters
         """
-        if not datetimes:
+        if len(datetimes) == 0:
             return np.array([])
 
-        heights = np.zeros(len(datetimes))
-
-        for i, dt in enumerate(datetimes):
-            # Convert to UTC
-            if dt.tzinfo is not None:
-                dt_utc = dt.replace(tzinfo=None) - dt.utcoffset()
-            else:
-                dt_utc = dt
-
-            # Calculate Julian centuries and hour of day for this instant
-            T = _julian_centuries(dt_utc)
-            hour = dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0
-
-            # Calculate astronomical arguments at this instant
-            astro = _astronomical_arguments(T, hour)
-
-            # Get nodal corrections (slowly varying, computed at this instant)
-            nodal = _nodal_corrections(astro['N'], astro['p'])
-
-            # Hour angle in degrees (15° per hour from midnight)
-            hour_angle = hour * 15.0
-
-            # Sum contributions from each constituent
-            for const_name, (amplitude, kappa) in constituents.items():
-                const = const_name.lower()
-                if const not in self.CONSTITUENTS:
-                    continue
-
-                # Get nodal corrections
-                f, u = nodal.get(const, (1.0, 0.0))
-
-                # Calculate equilibrium argument V at this instant
-                # V includes the time-varying component via τ = T + h - s
-                V = _equilibrium_argument(
-                    const,
-                    astro['s'], astro['h'], astro['p'],
-                    astro['N'], astro['pp'],
-                    hour_angle  # T = hour angle (Greenwich hour angle of mean sun)
-                )
-
-                # FES2022 phase convention correction:
-                # Diurnal constituents (K1, O1, P1, Q1, J1, M1, OO1, RHO1, S1) need +180°
-                # This accounts for the phase convention difference between FES2022
-                # and standard harmonic prediction formulas
-                diurnal_constituents = {'k1', 'o1', 'p1', 'q1', 'j1', 'm1', 'oo1', 'rho1', 's1'}
-                kappa_corrected = kappa + 180.0 if const in diurnal_constituents else kappa
-
-                # Standard formula: h = f * H * cos(V + u - G)
-                # where G is Greenwich phase lag (kappa from FES2022)
-                phase_arg = V + u - kappa_corrected
-
-                # Add harmonic contribution
-                heights[i] += f * amplitude * np.cos(np.radians(phase_arg))
-
-        return heights
+        if time_factors is None:
+            time_factors = self._time_factors(datetimes)
+
+        # FES2022 phase convention correction:
+        # Diurnal constituents (K1, O1, P1, Q1, J1, M1, OO1, RHO1, S1) need +180°
+        # This accounts for the phase convention difference between FES2022
+        # and standard harmonic prediction formulas
+        # (applied once per location in _load_constituents)
+        amplitudes = constituents['amplitudes']
+        kappas = constituents['kappas']
+
+        # Nodal corrections per constituent, shape (K,)
+        index = constituents['index']
+        f = time_factors['f'][index]
+        u = time_factors['u'][index]
+
+        # Standard formula: h = f * H * cos(V + u - G)
+        # where G is Greenwich phase lag (kappa from FES2022)
+        return _harmonic_kernel(
+            time_factors['astro_args'], constituents['doodson'], amplitudes, kappas, f, u
+        )
     
     def predict_tides(
         self,
@@ -774,16 +1272,16 @@ class FES2022TideService:
         num_points = days * 24 * 20  # 20 points per hour = 3 minute intervals
         time_offsets_hours = np.linspace(0, days * 24, num_points)
 
-        # Create datetime objects for each time point
-        datetimes = [start_time + timedelta(hours=float(h)) for h in time_offsets_hours]
+        # UTC sample times as a datetime64 array
+        times = _utc_time_axis(start_time, time_offsets_hours)
 
         # Load constituent data for this location
         constituents = self._load_constituents(lat, lon)
-        if not constituents:
+        if not constituents['names']:
             raise ValueError(f"No tide data available for location ({lat}, {lon})")
 
         # Calculate tide heights using astronomical arguments
-        heights = self._calculate_harmonic_tide_at_times(datetimes, constituents)
+        heights = self._calculate_harmonic_tide_at_times(times, constituents)
 
         # Calculate and apply datum offset
         if datum_offset is not None:
@@ -799,48 +1297,121 @@ class FES2022TideService:
             datum_used = datum.value
 
         # Find high and low tides (local extrema)
-        events = []
+        return self._find_extrema_from_heights(heights, time_offsets_hours, start_time, datum_used)
 
-        # Use gradient to find zero crossings (extrema)
-        gradient = np.gradient(heights)
-        sign_changes = np.where(np.diff(np.sign(gradient)))[0]
-
-        for idx in sign_changes:
-            if idx < 1 or idx >= len(heights) - 1:
-                continue
-
-            # Determine if it's a high or low tide based on gradient direction
-            # If gradient goes from positive to negative, it's a maximum (high tide)
-            # If gradient goes from negative to positive, it's a minimum (low tide)
-            if gradient[idx] > 0 and gradient[idx + 1] <= 0:
-                tide_type = 'high'
-            elif gradient[idx] < 0 and gradient[idx + 1] >= 0:
-                tide_type = 'low'
-            else:
-                continue
-
-            # Use parabolic interpolation to find sub-sample extremum time
-            # This improves timing accuracy by finding the true peak/trough between samples
-            # Fit parabola through 3 points: (idx-1, idx, idx+1)
-            h1, h2, h3 = heights[idx - 1], heights[idx], heights[idx + 1]
-            t2 = time_offsets_hours[idx]
-            dt = time_offsets_hours[idx + 1] - t2  # Time step between samples
-
-            # Parabolic interpolation formula for vertex
-            # For a parabola through 3 equally-spaced points, the vertex offset from center is:
-            # t_offset = 0.5 * (h1 - h3) / (h1 - 2*h2 + h3) * dt
-            denom = (h1 - 2*h2 + h3)
-            if abs(denom) > 1e-10:
-                t_offset = 0.5 * (h1 - h3) / denom * dt
-                t_extremum = t2 + t_offset
-                # Interpolate the height at the true extremum
-                height_m = float(h2 - 0.25 * (h1 - h3) * (h1 - h3) / denom)
-            else:
-                t_extremum = t2
-                height_m = float(h2)
+    def predict_tides_batch(
+        self,
+        coords: List[Tuple[float, float]],
+        days: int = 7,
+        timezone_str: Optional[str] = None,
+        datum: TidalDatum = TidalDatum.MSL
+    ) -> List[List[Dict]]:
+        """
+        Predict tide events for several locations at once.
+
+        Same results as calling predict_tides for each location, but the
+        constituents of all locations are read in one constituent-major pass
+        (see preload_constituents), and the time-dependent astronomical arguments
+        and nodal corrections are computed once and shared by all locations with
+        the same start time (same timezone).
+
+        Args:
+            coords: List of (lat, lon) tuples in degrees
+            days: Number of days to predict (1-30)
+            timezone_str: Timezone string or None to auto-detect per location
+            datum: Tidal datum reference (MSL, MLLW, or LAT). Default is MSL.
+
+        Returns:
+            List with one list of tide events per location, in the order of coords
+            (see predict_tides for the event format)
+        """
+        # Generate time array (every 3 minutes for accurate extrema detection)
+        num_points = days * 24 * 20  # 20 points per hour = 3 minute intervals
+        time_offsets_hours = np.linspace(0, days * 24, num_points)
+
+        # Read every location's constituents file by file rather than location by location
+        self.preload_constituents(coords)
+
+        results = []
+        for lat, lon in coords:
+            tz = self._get_timezone(lat, lon, timezone_str)
+            start_time = datetime.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
+
+            constituents = self._load_constituents(lat, lon)
+            if not constituents['names']:
+                raise ValueError(f"No tide data available for location ({lat}, {lon})")
+
+            # Locations with the same start time hit the same cached time factors
+            times = _utc_time_axis(start_time, time_offsets_hours)
+            time_factors = self._time_factors(times)
+
+            heights = self._calculate_harmonic_tide_at_times(times, constituents, time_factors=time_factors)
+            heights += self._calculate_datum_offset(lat, lon, datum, days=min(days, 30))
+
+            results.append(
+                self._find_extrema_from_heights(heights, time_offsets_hours, start_time, datum.value)
+            )
+
+        return results
+
+    def _find_extrema_from_heights(
+        self,
+        heights: np.ndarray,
+        time_offsets_hours: np.ndarray,
+        start_time: datetime,
+        datum_used: str
+    ) -> List[Dict]:
+        """
+        Find high and low tide events in a sampled tide curve.
+
+        Local maxima and minima are found by comparing each sample with its two
+        neighbours, and all of them are refined at once with parabolic interpolation.
+
+        Args:
+            heights: Tide heights in meters at each sample
+            time_offsets_hours: Hours since start_time for each sample
+            start_time: Datetime of the first sample
+            datum_used: Datum label stored on each event
+
+        Returns:
+            List of tide event dictionaries sorted by time
+        """
+        if len(heights) < 3:
+            return []
+
+        # Interior samples that are higher (high tide) or lower (low tide) than both
+        # neighbours. The non-strict comparison on the right side reports a flat
+        # top or bottom once, at its first sample.
+        prev_h, center, next_h = heights[:-2], heights[1:-1], heights[2:]
+        is_high = (center > prev_h) & (center >= next_h)
+        is_low = (center < prev_h) & (center <= next_h)
+        candidates = np.flatnonzero(is_high | is_low) + 1
+        candidate_is_high = is_high[candidates - 1]
+
+        # Use parabolic interpolation to find sub-sample extremum times and heights
+        # This improves timing accuracy by finding the true peak/trough between samples
+        # Fit parabola through 3 points: (idx-1, idx, idx+1)
+        h1, h2, h3 = heights[candidates - 1], heights[candidates], heights[candidates + 1]
+        t2 = time_offsets_hours[candidates]
+        dt = time_offsets_hours[candidates + 1] - t2  # Time step between samples
+
+        # Parabolic interpolation formula for vertex
+        # For a parabola through 3 equally-spaced points, the vertex offset from center is:
+        # t_offset = 0.5 * (h1 - h3) / (h1 - 2*h2 + h3) * dt
+        denom = h1 - 2 * h2 + h3
+        curved = np.abs(denom) > 1e-10
+        safe_denom = np.where(curved, denom, 1.0)
+        t_extrema = np.where(curved, t2 + 0.5 * (h1 - h3) / safe_denom * dt, t2)
+        # Interpolate the height at the true extremum
+        heights_m = np.where(curved, h2 - 0.25 * (h1 - h3) * (h1 - h3) / safe_denom, h2)
+
+        events = []
+        for high, t_extremum, height_m in zip(candidate_is_high, t_extrema, heights_m):
+            tide_type = 'high' if high else 'low'
+            height_m = float(height_m)
 
             # Convert hours offset back to datetime
-            event_time = start_time + timedelta(hours=float(t_extremum))
+            event_time = _local_time(start_time, float(t_extremum))
             event_time = event_time.replace(microsecond=0)  # Remove microseconds for cleaner ISO output
             height_ft = height_m * 3.28084  # Convert to feet
 
@@ -867,6 +1438,10 @@ class FES2022TideService:
         """
         Calculate the offset needed to convert from MSL to the target datum.
 
+        Offsets are cached per location rounded to 0.001° (~100 m, well inside one
+        1/30° grid cell), datum, analysis length and UTC day, so repeated requests
+        for a spot skip the 30-day MSL prediction behind each offset.
+
         Args:
             lat: Latitude in degrees
             lon: Longitude in degrees
@@ -879,25 +1454,40 @@ class FES2022TideService:
         if target_datum == TidalDatum.MSL:
             return 0.0
 
+        # The analysis window starts at today's UTC midnight, so offsets change daily
+        key = (round(lat, 3), round(lon, 3), target_datum, days, datetime.now(timezone.utc).date())
+        cached = self._datum_offsets.get(key)
+        if cached is not None:
+            return cached
+
+        offset = self._compute_datum_offset(lat, lon, target_datum, days)
+
+        # Evict the oldest entry so arbitrary coordinates can't grow the cache without bound
+        if len(self._datum_offsets) >= self.DATUM_OFFSET_CACHE_SIZE:
+            self._datum_offsets.pop(next(iter(self._datum_offsets)))
+        self._datum_offsets[key] = offset
+        return offset
+
+    def _compute_datum_offset(self, lat: float, lon: float, target_datum: TidalDatum, days: int) -> float:
+        """Compute the MSL to target datum offset from an MSL prediction (uncached)."""
         # Get predictions in MSL to calculate the datum offset
         events = self.predict_tides(lat, lon, days=days, timezone_str='UTC', datum=TidalDatum.MSL)
 
         if not events:
             return 0.0
 
-        from collections import defaultdict
-
         if target_datum == TidalDatum.MLLW:
             # MLLW: Mean Lower Low Water - average of daily lower low tides
-            daily_lows = defaultdict(list)
-            for event in events:
-                if event['type'] == 'low':
-                    day = event['datetime'][:10]
-                    daily_lows[day].append(event['height_m'])
-
-            if daily_lows:
-                lower_lows = [min(heights) for heights in daily_lows.values()]
-                mllw_level = np.mean(lower_lows)
+            lows = [event for event in events if event['type'] == 'low']
+
+            if lows:
+                # Group lows by calendar day and take each day's minimum in one reduction
+                days_of_lows = np.array([event['datetime'][:10] for event in lows], dtype='datetime64[D]')
+                low_heights = np.array([event['height_m'] for event in lows])
+                _, day_index = np.unique(days_of_lows, return_inverse=True)
+                lower_lows = np.full(day_index.max() + 1, np.inf)
+                np.minimum.at(lower_lows, day_index, low_heights)
+                mllw_level = float(np.mean(lower_lows))
                 # MLLW level is typically negative in MSL (e.g., -0.865m)
                 # To convert: height_MLLW = height_MSL - mllw_level
                 # If mllw_level = -0.865, then offset = -(-0.865) = +0.865
@@ -990,17 +1580,17 @@ class FES2022TideService:
         num_points = days * 24 * points_per_hour + 1  # +1 to include end point
         time_offsets_hours = np.linspace(0, days * 24, num_points)
 
-        # Create datetime objects for each time point
-        datetimes = [start_time + timedelta(hours=float(h)) for h in time_offsets_hours]
+        # UTC sample times as a datetime64 array
+        times = _utc_time_axis(start_time, time_offsets_hours)
 
         # Load constituent data for this location
         constituents = self._load_constituents(lat, lon)
 
-        if not constituents:
+        if not constituents['names']:
             raise ValueError(f"No tide data available for location ({lat}, {lon})")
 
         # Calculate tide heights
-        heights = self._calculate_harmonic_tide_at_times(datetimes, constituents)
+        heights = self._calculate_harmonic_tide_at_times(times, constituents)
 
         # Calculate and apply datum offset
         if datum_offset is not None:
@@ -1015,14 +1605,18 @@ class FES2022TideService:
             heights += offset_to_apply
             datum_used = datum.value
 
+        # Round and convert units for the whole curve at once
+        heights_m = np.round(heights, 3).tolist()
+        heights_ft = np.round(heights * 3.28084, 3).tolist()
+
         # Build result list
         results = []
-        for i, dt in enumerate(datetimes):
-            height_m = float(heights[i])
+        for hours, height_m, height_ft in zip(time_offsets_hours.tolist(), heights_m, heights_ft):
+            dt = _local_time(start_time, hours)
             results.append({
                 'datetime': dt.replace(microsecond=0).isoformat(),
-                'height_m': round(height_m, 3),
-                'height_ft': round(height_m * 3.28084, 3),
+                'height_m': height_m,
+                'height_ft': height_ft,
                 'datum': datum_used
             })
 
@@ -1070,15 +1664,15 @@ class FES2022TideService:
         # Generate HIGH-RESOLUTION time array (3-minute intervals for accurate extrema)
         num_points_highres = days * 24 * 20  # 20 points per hour = 3 minute intervals
         time_offsets_hours_highres = np.linspace(0, days * 24, num_points_highres)
-        datetimes_highres = [start_time + timedelta(hours=float(h)) for h in time_offsets_hours_highres]
+        times_highres = _utc_time_axis(start_time, time_offsets_hours_highres)
 
         # Load constituent data for this location
         constituents = self._load_constituents(lat, lon)
-        if not constituents:
+        if not constituents['names']:
             raise ValueError(f"No tide data available for location ({lat}, {lon})")
 
         # Calculate tide heights at HIGH RESOLUTION (single expensive computation)
-        heights_highres = self._calculate_harmonic_tide_at_times(datetimes_highres, constituents)
+        heights_highres = self._calculate_harmonic_tide_at_times(times_highres, constituents)
 
         # Apply datum offset
         offset_to_apply = self._calculate_datum_offset(lat, lon, datum, days=min(days, 30))
@@ -1090,62 +1684,24 @@ class FES2022TideService:
         # 3 min base, so 15 min = every 5th, 30 min = every 10th, 60 min = every 20th
         step = interval_minutes // 3
 
+        interval_samples = heights_highres[::step]
         interval_heights = []
-        for i in range(0, len(heights_highres), step):
-            if i < len(datetimes_highres):
-                dt = datetimes_highres[i]
-                height_m = float(heights_highres[i])
-                interval_heights.append({
-                    'datetime': dt.replace(microsecond=0).isoformat(),
-                    'height_m': round(height_m, 3),
-                    'height_ft': round(height_m * 3.28084, 3),
-                    'datum': datum_used
-                })
-
-        # === FIND EXTREMA (HIGH/LOW TIDES) ===
-        extrema_events = []
-        gradient = np.gradient(heights_highres)
-        sign_changes = np.where(np.diff(np.sign(gradient)))[0]
-
-        for idx in sign_changes:
-            if idx < 1 or idx >= len(heights_highres) - 1:
-                continue
-
-            # Determine if it's a high or low tide
-            if gradient[idx] > 0 and gradient[idx + 1] <= 0:
-                tide_type = 'high'
-            elif gradient[idx] < 0 and gradient[idx + 1] >= 0:
-                tide_type = 'low'
-            else:
-                continue
-
-            # Parabolic interpolation for precise timing
-            h1, h2, h3 = heights_highres[idx - 1], heights_highres[idx], heights_highres[idx + 1]
-            t2 = time_offsets_hours_highres[idx]
-            dt = time_offsets_hours_highres[idx + 1] - t2
-
-            denom = (h1 - 2*h2 + h3)
-            if abs(denom) > 1e-10:
-                t_offset = 0.5 * (h1 - h3) / denom * dt
-                t_extremum = t2 + t_offset
-                height_m = float(h2 - 0.25 * (h1 - h3) * (h1 - h3) / denom)
-            else:
-                t_extremum = t2
-                height_m = float(h2)
-
-            event_time = start_time + timedelta(hours=float(t_extremum))
-            event_time = event_time.replace(microsecond=0)
-            height_ft = height_m * 3.28084
-
-            extrema_events.append({
-                'type': tide_type,
-                'datetime': event_time.isoformat(),
-                'height_m': round(height_m, 3),
-                'height_ft': round(height_ft, 3),
+        for hours, height_m, height_ft in zip(
+            time_offsets_hours_highres[::step].tolist(),
+            np.round(interval_samples, 3).tolist(),
+            np.round(interval_samples * 3.28084, 3).tolist()
+        ):
+            dt = _local_time(start_time, hours)
+            interval_heights.append({
+                'datetime': dt.replace(microsecond=0).isoformat(),
+                'height_m': height_m,
+                'height_ft': height_ft,
                 'datum': datum_used
             })
 
-        # Sort extrema by time
-        extrema_events.sort(key=lambda x: x['datetime'])
+        # === FIND EXTREMA (HIGH/LOW TIDES) ===
+        extrema_events = self._find_extrema_from_heights(
+            heights_highres, time_offsets_hours_highres, start_time, datum_used
+        )
 
         return interval_heights, extrema_events
@@ -0,0 +1,47 @@
+"""
+Timezone lookup from coordinates, shared by the tide and astronomy services.
+
+Loading the timezone polygons is expensive, so one TimezoneFinder is created
+on first use and kept for the life of the process. Lookups are memoized per
+location, since the API and the comparison report ask about the same spots
+over and over.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from timezonefinder import TimezoneFinder
+
+
+# Shared TimezoneFinder, created on first use (see _get_tz_finder)
+_TZ_FINDER = None
+
+
+def _get_tz_finder() -> TimezoneFinder:
+    """Return the module-wide TimezoneFinder, creating it on first use."""
+    global _TZ_FINDER
+    if _TZ_FINDER is None:
+        _TZ_FINDER = TimezoneFinder(in_memory=True)
+    return _TZ_FINDER
+
+
+@lru_cache(maxsize=1024)
+def _timezone_name_at_rounded(lat: float, lon: float) -> Optional[str]:
+    return _get_tz_finder().timezone_at(lat=lat, lng=lon)
+
+
+def timezone_name_at(lat: float, lon: float) -> Optional[str]:
+    """
+    Get the IANA timezone name for coordinates.
+
+    Coordinates are rounded to 0.001° (~100 m) before the lookup so nearby
+    requests share a cache entry.
+
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+
+    Returns:
+        Timezone name (e.g., 'America/Los_Angeles'), or None if not found
+    """
+    return _timezone_name_at_rounded(round(lat, 3), round(lon, 3))
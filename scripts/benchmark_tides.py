@@ -0,0 +1,147 @@
+"""
+Time the stages of a FES2022 tide prediction separately.
+
+Splits a prediction into the constituent lookup (NetCDF reads, I/O- and
+memory-bound) and the harmonic synthesis of a 3-minute curve (NumPy arithmetic,
+compute-bound), so optimization work can target whichever stage dominates. The
+end_to_end stage times the full get_tides_with_extrema call, which adds the
+datum offset lookup, extrema refinement and building the response dicts. Also
+times a long range of sun and moon events (Skyfield root finding). Results can be saved
+as JSON and compared against a previous run:
+
+    python scripts/benchmark_tides.py --save .benchmarks/baseline.json
+    python scripts/benchmark_tides.py --compare .benchmarks/baseline.json
+
+With --compare the script exits with status 1 if any stage's mean is more than
+--max-regression (default 10%) slower than the baseline.
+
+Usage:
+    python scripts/benchmark_tides.py [--lat LAT] [--lon LON] [--days N] [--interval 15|30|60] [--repeat N]
+                                      [--astronomy-days N] [--astronomy-repeat N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Allow running from the repository root without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app.astronomy_service import AstronomyService  # noqa: E402
+from app.tide_service import FES2022TideService, _utc_time_axis  # noqa: E402
+
+
+def _time_call(func, repeat: int) -> list:
+    """Run func repeat times and return the wall-clock durations in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Time the stages of a FES2022 tide prediction and of sun/moon events.')
+    parser.add_argument('--lat', type=float, default=34.03, help='Latitude in degrees (default: Malibu)')
+    parser.add_argument('--lon', type=float, default=-118.68, help='Longitude in degrees (default: Malibu)')
+    parser.add_argument('--days', type=int, default=30, help='Number of days to predict (default: 30)')
+    parser.add_argument('--interval', type=int, choices=[15, 30, 60], default=15,
+                        help='Interval in minutes for the end-to-end stage (default: 15)')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per stage (default: 20)')
+    parser.add_argument('--astronomy-days', type=int, default=365,
+                        help='Days of sun/moon events to compute (default: 365, 0 to skip)')
+    parser.add_argument('--astronomy-repeat', type=int, default=3,
+                        help='Timed runs per astronomy stage (default: 3)')
+    parser.add_argument('--data-path', default=os.environ.get('FES_DATA_PATH', './'),
+                        help="Directory containing 'ocean_tide_extrapolated' (default: FES_DATA_PATH or ./)")
+    parser.add_argument('--save', help='Write the results as JSON to this path')
+    parser.add_argument('--compare', help='Compare against results saved with --save')
+    parser.add_argument('--max-regression', type=float, default=0.10,
+                        help='Allowed slowdown of a stage mean with --compare (default: 0.10)')
+    args = parser.parse_args()
+
+    service = FES2022TideService(data_path=args.data_path)
+    service.open_datasets()
+
+    def lookup():
+        # Bypass the per-location cache so every run reads the NetCDF files
+        service._constituents_cache.pop((args.lat, args.lon), None)
+        service._load_constituents(args.lat, args.lon)
+
+    # The 3-minute UTC axis get_tides_with_extrema synthesises, built once
+    num_points = args.days * 24 * 20
+    times = _utc_time_axis(datetime(2023, 1, 1, tzinfo=timezone.utc), np.linspace(0, args.days * 24, num_points))
+
+    def synthesis():
+        # Time factors are part of the synthesis cost, so recompute them every run
+        service._time_factors_cache.clear()
+        service._calculate_harmonic_tide_at_times(times, service._load_constituents(args.lat, args.lon))
+
+    def end_to_end():
+        service._time_factors_cache.clear()
+        service.get_tides_with_extrema(
+            lat=args.lat, lon=args.lon, days=args.days, interval_minutes=args.interval
+        )
+
+    # Warm up: opens files, fills the chunk cache and the datum offset cache
+    lookup()
+    end_to_end()
+
+    stages = {
+        'constituent_lookup': _time_call(lookup, args.repeat),
+        'harmonic_synthesis': _time_call(synthesis, args.repeat),
+        'end_to_end': _time_call(end_to_end, args.repeat),
+    }
+
+    if args.astronomy_days > 0:
+        astronomy = AstronomyService()
+        start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+        def sun_events():
+            # Bypass the result cache so every run does the root finding
+            astronomy._sun_events_cache.clear()
+            astronomy.get_sun_events(args.lat, args.lon, start_date, days=args.astronomy_days)
+
+        stages['sun_events'] = _time_call(sun_events, args.astronomy_repeat)
+        stages['moon_events'] = _time_call(
+            lambda: astronomy.get_moon_events(args.lat, args.lon, start_date, days=args.astronomy_days),
+            args.astronomy_repeat,
+        )
+
+    results = {
+        name: {'mean': statistics.mean(durations), 'min': min(durations)}
+        for name, durations in stages.items()
+    }
+
+    for name, result in results.items():
+        print(f"{name:<20}  mean {result['mean'] * 1000:8.2f} ms   min {result['min'] * 1000:8.2f} ms")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        failed = False
+        for name, result in results.items():
+            if name not in baseline:
+                continue
+            change = result['mean'] / baseline[name]['mean'] - 1.0
+            print(f"{name:<20}  {change:+.1%} vs baseline")
+            if change > args.max_regression:
+                failed = True
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
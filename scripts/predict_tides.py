@@ -0,0 +1,44 @@
+"""
+Print FES2022 tide predictions for a location from the command line.
+
+Non-interactive, so it can be used in scripts and profiling runs, e.g.:
+    python -m cProfile -s cumtime scripts/predict_tides.py --lat 34.03 --lon -118.68
+
+Usage:
+    python scripts/predict_tides.py [--lat LAT] [--lon LON] [--days N] [--datum msl|mllw|lat]
+"""
+
+import argparse
+import os
+import sys
+
+# Allow running from the repository root without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app.tide_service import FES2022TideService, TidalDatum  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Print FES2022 tide predictions for a location.')
+    parser.add_argument('--lat', type=float, default=34.03, help='Latitude in degrees (default: Malibu)')
+    parser.add_argument('--lon', type=float, default=-118.68, help='Longitude in degrees (default: Malibu)')
+    parser.add_argument('--days', type=int, default=7, help='Number of days to predict (default: 7)')
+    parser.add_argument('--datum', choices=[d.value for d in TidalDatum], default=TidalDatum.MSL.value,
+                        help='Tidal datum (default: msl)')
+    parser.add_argument('--timezone', default=None, help='Timezone name (default: auto-detect)')
+    parser.add_argument('--data-path', default=os.environ.get('FES_DATA_PATH', './'),
+                        help="Directory containing 'ocean_tide_extrapolated' (default: FES_DATA_PATH or ./)")
+    args = parser.parse_args()
+
+    service = FES2022TideService(data_path=args.data_path)
+    tides = service.predict_tides(
+        lat=args.lat, lon=args.lon, days=args.days,
+        timezone_str=args.timezone, datum=TidalDatum(args.datum)
+    )
+
+    for tide in tides:
+        print(f"{tide['datetime']}  {tide['type']:<4}  {tide['height_m']:7.3f} m  ({tide['datum']})")
+
+
+if __name__ == '__main__':
+    main()
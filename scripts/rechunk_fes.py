@@ -0,0 +1,76 @@
+"""
+Rechunk FES2022 constituent files for point queries.
+
+The FES2022 NetCDF files ship with large lat/lon chunks suited to reading
+whole rasters. The tide service reads a 2x2 block of cells per location, so
+every lookup decompresses a full chunk. This script copies each
+`<constituent>_fes2022.nc` file from `ocean_tide_extrapolated/` into
+`ocean_tide_extrapolated_rechunked/` with small chunks. FES2022TideService
+uses the rechunked copy automatically when it exists.
+
+Trade-off: the rechunked files are larger (more chunk overhead, weaker
+compression), in exchange for much cheaper point reads.
+
+Usage:
+    python scripts/rechunk_fes.py [--data-path PATH] [--chunk 8]
+"""
+
+import argparse
+import glob
+import os
+
+from netCDF4 import Dataset
+
+
+def rechunk_file(src_path: str, dst_path: str, chunk: int) -> None:
+    """Copy one NetCDF file, writing 2D (lat, lon) variables with chunk x chunk chunks."""
+    tmp_path = f"{dst_path}.tmp"
+    with Dataset(src_path, 'r') as src, Dataset(tmp_path, 'w', format='NETCDF4') as dst:
+        dst.setncatts({name: src.getncattr(name) for name in src.ncattrs()})
+
+        for name, dim in src.dimensions.items():
+            dst.createDimension(name, None if dim.isunlimited() else len(dim))
+
+        for name, var in src.variables.items():
+            chunksizes = None
+            if len(var.dimensions) == 2:
+                chunksizes = tuple(min(chunk, len(src.dimensions[d])) for d in var.dimensions)
+
+            fill_value = getattr(var, '_FillValue', None)
+            out = dst.createVariable(
+                name, var.datatype, var.dimensions,
+                zlib=True, complevel=1, shuffle=True,
+                chunksizes=chunksizes, fill_value=fill_value
+            )
+            out.setncatts({k: var.getncattr(k) for k in var.ncattrs() if k != '_FillValue'})
+
+            # Copy raw values (no masking/scaling round-trip)
+            var.set_auto_maskandscale(False)
+            out.set_auto_maskandscale(False)
+            out[...] = var[...]
+
+    os.replace(tmp_path, dst_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--data-path', default=os.environ.get('FES_DATA_PATH', './'),
+                        help="Directory containing 'ocean_tide_extrapolated' (default: FES_DATA_PATH or ./)")
+    parser.add_argument('--chunk', type=int, default=8,
+                        help='Chunk edge length in grid cells (default: 8)')
+    args = parser.parse_args()
+
+    src_dir = os.path.join(args.data_path, 'ocean_tide_extrapolated')
+    dst_dir = os.path.join(args.data_path, 'ocean_tide_extrapolated_rechunked')
+    os.makedirs(dst_dir, exist_ok=True)
+
+    for src_path in sorted(glob.glob(os.path.join(src_dir, '*_fes2022.nc'))):
+        dst_path = os.path.join(dst_dir, os.path.basename(src_path))
+        print(f"Rechunking {os.path.basename(src_path)}...")
+        rechunk_file(src_path, dst_path, args.chunk)
+
+    print(f"Done. Rechunked files are in {dst_dir}")
+
+
+if __name__ == '__main__':
+    main()
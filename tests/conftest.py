@@ -0,0 +1,51 @@
+"""
+Shared pytest fixtures.
+"""
+
+import os
+
+import pytest
+
+# Don't build the API's tide service at import time; tests inject the session
+# service below, and astronomy-only tests never need the FES2022 files
+os.environ.setdefault("DEFER_FES_LOAD", "1")
+
+from app.astronomy_service import AstronomyService
+from app.locations import TEST_LOCATIONS
+from app.tide_service import FES2022TideService
+
+
+@pytest.fixture(scope="session")
+def astronomy_service():
+    """Create one astronomy service for the whole test session."""
+    # Loading the DE421 ephemeris dominates construction; the service holds no per-call state
+    return AstronomyService()
+
+
+@pytest.fixture(scope="session")
+def tide_service():
+    """Create one tide service for the whole test session, preloaded with the test locations."""
+    service = FES2022TideService(data_path='./')
+    service.preload_constituents([(location.lat, location.lon) for location in TEST_LOCATIONS])
+    yield service
+    service.close()
+
+
+@pytest.fixture(scope="session")
+def predicted_tides(tide_service):
+    """
+    Memoized predict_tides for structure-only tests.
+
+    Returns a function taking the same arguments as predict_tides; each
+    parameter combination is predicted once per session. Tests must not
+    mutate the returned events.
+    """
+    cache = {}
+
+    def predict(lat, lon, days=7, **kwargs):
+        key = (lat, lon, days, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = tide_service.predict_tides(lat=lat, lon=lon, days=days, **kwargs)
+        return cache[key]
+
+    return predict
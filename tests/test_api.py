@@ -2,16 +2,28 @@
 API endpoint tests for FastAPI application.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app import main
+from app.main import app, get_tide_service
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+@pytest.fixture(scope="session")
+def client(tide_service):
+    """Create a test client for the FastAPI app, shared across the session."""
+    # Reuse the session tide service so NetCDF files are opened once per suite
+    app.dependency_overrides[get_tide_service] = lambda: tide_service
+    with TestClient(app) as test_client:
+        # One warm-up request so the first test doesn't pay for router/middleware setup
+        test_client.get("/health")
+        yield test_client
+    app.dependency_overrides.pop(get_tide_service, None)
 
 
 class TestHealthEndpoint:
@@ -182,6 +194,18 @@ class TestSunMoonEndpoint:
         data = response.json()
         assert data[0]["date"] == "2024-06-21"
 
+    def test_sun_moon_events_fall_within_the_local_day(self, client):
+        """Each day should run from local midnight, so sunrise < solar noon < sunset."""
+        # With UTC-midnight days, LA's 'day' paired the previous evening's sunset with that morning's sunrise
+        response = client.get("/api/v1/sun-moon?lat=34.05&lon=-118.24&date=2023-06-21")
+        assert response.status_code == 200
+        for day in response.json():
+            sunrise, solar_noon, sunset = (
+                datetime.fromisoformat(day[field]) for field in ("sunrise", "solar_noon", "sunset")
+            )
+            assert sunrise < solar_noon < sunset, f"Sun events out of order on {day['date']}"
+            assert sunrise.date().isoformat() == sunset.date().isoformat() == day["date"]
+
     def test_sun_moon_invalid_date(self, client):
         """Sun-moon endpoint should reject invalid date format."""
         response = client.get("/api/v1/sun-moon?lat=34.03&lon=-118.68&days=1&date=invalid")
@@ -202,7 +226,7 @@ class TestSunMoonEndpoint:
 
         sunrise = data[0]["sunrise"]
         # LA times should have Pacific timezone offset
-        assert "-07:00" in sunrise or "-08:00" in sunrise
+        assert sunrise[-6:] in {"-07:00", "-08:00"}
 
 
 class TestSunMoonTidesEndpoint:
@@ -281,13 +305,20 @@ class TestSunMoonTidesEndpoint:
 class TestGlobalLocations:
     """Tests for various global locations."""
 
-    @pytest.mark.parametrize("name,lat,lon", [
+    LOCATIONS = [
         ("Los Angeles", 34.03, -118.68),
         ("Sydney", -33.87, 151.21),
         ("Tokyo", 35.68, 139.69),
         ("London", 51.5, -0.12),
         ("Cape Town", -33.92, 18.42),
-    ])
+    ]
+
+    @pytest.fixture(scope="class", autouse=True)
+    def preloaded_locations(self, tide_service):
+        """Load constituents for all locations in one pass before the requests."""
+        tide_service.preload_constituents([(lat, lon) for _, lat, lon in self.LOCATIONS])
+
+    @pytest.mark.parametrize("name,lat,lon", LOCATIONS)
     def test_tides_global_locations(self, client, name, lat, lon):
         """Tides endpoint should work for global locations."""
         response = client.get(f"/api/v1/tides?lat={lat}&lon={lon}&days=1")
@@ -295,11 +326,7 @@ class TestGlobalLocations:
         data = response.json()
         assert len(data) > 0, f"No tides for {name}"
 
-    @pytest.mark.parametrize("name,lat,lon", [
-        ("Los Angeles", 34.03, -118.68),
-        ("Sydney", -33.87, 151.21),
-        ("Tokyo", 35.68, 139.69),
-    ])
+    @pytest.mark.parametrize("name,lat,lon", LOCATIONS[:3])
     def test_sun_moon_global_locations(self, client, name, lat, lon):
         """Sun-moon endpoint should work for global locations."""
         response = client.get(f"/api/v1/sun-moon?lat={lat}&lon={lon}&days=1")
@@ -308,5 +335,32 @@ class TestGlobalLocations:
         assert data[0]["sunrise"] is not None, f"No sunrise for {name}"
 
 
+class TestTideServiceDependency:
+    """Tests for the lazily created tide service."""
+
+    def test_concurrent_first_calls_create_one_service(self, monkeypatch):
+        """Concurrent first requests should share a single service instance."""
+        created = []
+
+        class SlowService:
+            def __init__(self, **kwargs):
+                time.sleep(0.05)  # Widen the window in which other threads arrive
+                created.append(self)
+
+        monkeypatch.setattr(main, "_tide_service", None)
+        monkeypatch.setattr(main, "FES2022TideService", SlowService)
+        start = threading.Barrier(8)
+
+        def first_call(_):
+            start.wait()
+            return get_tide_service()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            services = list(pool.map(first_call, range(8)))
+
+        assert len(created) == 1
+        assert all(service is created[0] for service in services)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,17 +3,47 @@ Unit tests for Astronomy Service
 """
 
 import math
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
-from app.astronomy_service import AstronomyService
+# Shared test date and coordinates
+SOLSTICE_2023 = datetime(2023, 6, 21, tzinfo=timezone.utc)
+LA = (34.05, -118.24)
+ROME = (41.9, 12.5)
+
+# Sun event fields in chronological order
+SUN_EVENT_FIELDS = ("civil_dawn", "sunrise", "solar_noon", "sunset", "civil_dusk")
+
+# Fields of each day returned by get_all_astronomical_info
+EXPECTED_DAY_KEYS = frozenset(
+    ("date",) + SUN_EVENT_FIELDS
+    + ("moonrise", "moonset", "moon_phase", "moon_phase_angle", "moon_illumination")
+)
+
+
+def _offset(timestamp):
+    """UTC offset suffix (e.g. '-07:00') of an ISO 8601 timestamp."""
+    return timestamp[-6:]
+
+
+def assert_same_events(actual, expected, tolerance_seconds=2):
+    """Assert two per-day event dicts match, allowing root-finding jitter in the times."""
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if key != "date" and isinstance(value, str) and value[:1].isdigit():
+            assert actual[key] is not None, f"{key} missing"
+            delta = datetime.fromisoformat(actual[key]) - datetime.fromisoformat(value)
+            assert abs(delta.total_seconds()) <= tolerance_seconds, f"{key}: {actual[key]} != {value}"
+        else:
+            assert actual[key] == value, f"{key}: {actual[key]} != {value}"
 
 
 @pytest.fixture
-def service():
-    """Create an astronomy service instance for testing."""
-    return AstronomyService()
+def service(astronomy_service):
+    """Astronomy service instance for testing (shared across the session, see conftest.py)."""
+    return astronomy_service
 
 
 class TestAstronomyServiceInitialization:
@@ -32,9 +62,8 @@ class TestSunCalculations:
 
     def test_get_sun_events(self, service):
         """Should calculate sun events for a location."""
-        # Los Angeles coordinates
-        lat, lon = 34.05, -118.24
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)  # Summer solstice
+        lat, lon = LA
+        date = SOLSTICE_2023
 
         events = service.get_sun_events(lat, lon, date)
 
@@ -42,11 +71,8 @@ class TestSunCalculations:
 
         day_events = events[0]
         assert day_events["date"] == "2023-06-21"
-        assert day_events["civil_dawn"] is not None
-        assert day_events["sunrise"] is not None
-        assert day_events["solar_noon"] is not None
-        assert day_events["sunset"] is not None
-        assert day_events["civil_dusk"] is not None
+        for field in SUN_EVENT_FIELDS:
+            assert day_events[field] is not None, f"{field} missing"
 
         # Note: We don't verify specific ordering as the test date and location
         # might have unusual patterns, especially near poles or date line
@@ -54,8 +80,8 @@ class TestSunCalculations:
 
     def test_sun_events_multiple_days(self, service):
         """Should calculate sun events for multiple days."""
-        lat, lon = 34.05, -118.24
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)
+        lat, lon = LA
+        date = SOLSTICE_2023
         days = 3
 
         events = service.get_sun_events(lat, lon, date, days)
@@ -63,23 +89,84 @@ class TestSunCalculations:
         assert len(events) == days, f"Should return {days} days of events"
 
         # Verify dates are sequential
-        from datetime import timedelta
-
+        base = date.date()
+        expected_dates = [(base + timedelta(days=i)).isoformat() for i in range(days)]
         for i, day_events in enumerate(events):
-            expected_date = (date + timedelta(days=i)).strftime("%Y-%m-%d")
-            assert day_events["date"] == expected_date, (
-                f"Day {i} should have date {expected_date}"
+            assert day_events["date"] == expected_dates[i], (
+                f"Day {i} should have date {expected_dates[i]}"
             )
 
+    @pytest.mark.slow
+    @pytest.mark.parametrize("lat,lon", [LA, ROME, (-33.87, 151.21)])
+    def test_sun_events_chronological_order(self, service, lat, lon):
+        """Each day's sun events should be in chronological order."""
+        date = SOLSTICE_2023
+
+        for day in service.get_sun_events(lat, lon, date, days=3):
+            times = [datetime.fromisoformat(day[f]) for f in SUN_EVENT_FIELDS if day[f] is not None]
+            if times != sorted(times):
+                pytest.fail(f"Sun events out of order on {day['date']}: {day}")
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("lat,lon", [LA, ROME, (-33.87, 151.21)])
+    def test_events_fall_on_their_local_date(self, service, lat, lon):
+        """Every event time should be on the local calendar date of its day."""
+        date = SOLSTICE_2023
+        event_fields = SUN_EVENT_FIELDS + ("moonrise", "moonset")
+
+        for day in service.get_all_astronomical_info(lat, lon, date, days=3):
+            dates = {day[f][:10] for f in event_fields if day[f] is not None}
+            assert dates <= {day["date"]}, f"Mismatched dates on {day['date']}: {dates}"
+
+    @pytest.mark.slow
+    def test_multiple_days_match_single_day_calls(self, service):
+        """A multi-day range should give the same events as one call per day."""
+        lat, lon = LA
+        date = SOLSTICE_2023
+        days = 5
+
+        events = service.get_sun_events(lat, lon, date, days)
+        for i, day_events in enumerate(events):
+            single = service.get_sun_events(lat, lon, date + timedelta(days=i))[0]
+            assert_same_events(day_events, single)
+
+    def test_sun_events_are_cached(self, service):
+        """Repeated calls should reuse the cached result without sharing the dicts."""
+        lat, lon = LA
+        events1 = service.get_sun_events(lat, lon, SOLSTICE_2023, days=2)
+        events1[0]["sunrise"] = None
+        events2 = service.get_sun_events(lat, lon, SOLSTICE_2023, days=2)
+        assert events2[0]["sunrise"] is not None
+        assert events2 == service._compute_sun_events(lat, lon, SOLSTICE_2023, 2, None)
+
+    def test_sun_events_cache_keys_on_calendar_date(self, service):
+        """Different times on the same day should share one cache entry."""
+        lat, lon = 20.5, -40.5  # Not used by any other test, so the entry count is ours alone
+        morning = service.get_sun_events(lat, lon, SOLSTICE_2023 + timedelta(hours=1))
+        evening = service.get_sun_events(lat, lon, SOLSTICE_2023 + timedelta(hours=23, microseconds=1))
+        assert morning == evening
+        assert len([key for key in service._sun_events_cache if key[:2] == (lat, lon)]) == 1
+
+    @pytest.mark.slow
+    def test_moon_multiple_days_match_single_day_calls(self, service):
+        """A multi-day moon range should give the same events as one call per day."""
+        lat, lon = LA
+        date = SOLSTICE_2023
+        days = 5
+
+        events = service.get_moon_events(lat, lon, date, days)
+        for i, day_events in enumerate(events):
+            single = service.get_moon_events(lat, lon, date + timedelta(days=i))[0]
+            assert_same_events(day_events, single)
+
 
 class TestMoonCalculations:
     """Tests for moon-related calculations."""
 
     def test_get_moon_events(self, service):
         """Should calculate moon events for a location."""
-        # Los Angeles coordinates
-        lat, lon = 34.05, -118.24
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)
+        lat, lon = LA
+        date = SOLSTICE_2023
 
         events = service.get_moon_events(lat, lon, date)
 
@@ -91,44 +178,49 @@ class TestMoonCalculations:
         assert "moonset" in day_events
         assert day_events["phase"] is not None
         assert isinstance(day_events["phase_angle"], float)
-        assert isinstance(day_events["illumination"], int)
-        assert 0 <= day_events["illumination"] <= 100, "Illumination should be 0-100%"
-
-    def test_get_moon_phase_name(self, service):
+        illumination = day_events["illumination"]
+        assert isinstance(illumination, int)
+        assert illumination in range(0, 101), f"Illumination should be 0-100%, got: {illumination}"
+
+    @pytest.mark.parametrize("angle,expected_name", [
+        (0, "New Moon"),
+        (45, "Waxing Crescent"),
+        (90, "First Quarter"),
+        (135, "Waxing Gibbous"),
+        (180, "Full Moon"),
+        (225, "Waning Gibbous"),
+        (270, "Last Quarter"),
+        (315, "Waning Crescent"),
+        (354, "Waning Crescent"),
+        (355, "New Moon"),
+    ])
+    def test_get_moon_phase_name(self, service, angle, expected_name):
         """Should return correct moon phase names for different angles."""
-        test_cases = [
-            (0, "New Moon"),
-            (45, "Waxing Crescent"),
-            (90, "First Quarter"),
-            (135, "Waxing Gibbous"),
-            (180, "Full Moon"),
-            (225, "Waning Gibbous"),
-            (270, "Last Quarter"),
-            (315, "Waning Crescent"),
-            (354, "Waning Crescent"),
-        ]
-
-        for angle, expected_name in test_cases:
-            actual_name = service._get_moon_phase_name(angle)
-            assert actual_name == expected_name, (
-                f"Angle {angle} should be {expected_name}, got {actual_name}"
-            )
-
-    def test_get_moon_illumination(self, service):
+        actual_name = service._get_moon_phase_name(angle)
+        assert actual_name == expected_name, (
+            f"Angle {angle} should be {expected_name}, got {actual_name}"
+        )
+
+    def test_moon_phase_names_vectorized_matches_scalar(self, service):
+        """The array form should name every angle like the scalar form."""
+        angles = np.arange(0.0, 720.0, 0.5)
+        names = service._get_moon_phase_names(angles)
+        assert names == [service._get_moon_phase_name(angle) for angle in angles.tolist()]
+
+    @pytest.mark.parametrize("angle,expected_illum", [
+        (0, 0),  # New moon - 0%
+        (60, 25),  # Crescent - (1 - cos 60°) / 2 = 25%
+        (90, 50),  # First quarter - 50%
+        (180, 100),  # Full moon - 100%
+        (270, 50),  # Last quarter - 50%
+        (360, 0),  # New moon - 0%
+    ])
+    def test_get_moon_illumination(self, service, angle, expected_illum):
         """Should calculate correct moon illumination percentage."""
-        test_cases = [
-            (0, 0),  # New moon - 0%
-            (90, 50),  # First quarter - 50%
-            (180, 100),  # Full moon - 100%
-            (270, 50),  # Last quarter - 50%
-            (360, 0),  # New moon - 0%
-        ]
-
-        for angle, expected_illum in test_cases:
-            actual_illum = service._get_moon_illumination(angle)
-            assert actual_illum == expected_illum, (
-                f"Angle {angle} should be {expected_illum}%, got {actual_illum}%"
-            )
+        actual_illum = service._get_moon_illumination(angle)
+        assert actual_illum == expected_illum, (
+            f"Angle {angle} should be {expected_illum}%, got {actual_illum}%"
+        )
 
 
 class TestCombinedCalculations:
@@ -136,8 +228,8 @@ class TestCombinedCalculations:
 
     def test_get_all_astronomical_info(self, service):
         """Should return merged sun and moon data per day."""
-        lat, lon = 34.05, -118.24
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)
+        lat, lon = LA
+        date = SOLSTICE_2023
         days = 2
 
         result = service.get_all_astronomical_info(lat, lon, date, days)
@@ -145,19 +237,9 @@ class TestCombinedCalculations:
         assert isinstance(result, list), "Result should be a list"
         assert len(result) == days, f"Should return {days} days"
 
-        # Check first day has all expected fields
-        day = result[0]
-        assert "date" in day
-        assert "civil_dawn" in day
-        assert "sunrise" in day
-        assert "solar_noon" in day
-        assert "sunset" in day
-        assert "civil_dusk" in day
-        assert "moonrise" in day
-        assert "moonset" in day
-        assert "moon_phase" in day
-        assert "moon_phase_angle" in day
-        assert "moon_illumination" in day
+        # Check every day has all expected fields
+        for day in result:
+            assert EXPECTED_DAY_KEYS <= day.keys(), f"Missing fields: {EXPECTED_DAY_KEYS - day.keys()}"
 
 
 class TestTimezoneHandling:
@@ -165,8 +247,8 @@ class TestTimezoneHandling:
 
     def test_sun_events_use_local_timezone_los_angeles(self, service):
         """Sun events should return times in local timezone (Pacific for LA)."""
-        lat, lon = 34.05, -118.24  # Los Angeles
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)
+        lat, lon = LA
+        date = SOLSTICE_2023
 
         events = service.get_sun_events(lat, lon, date)
         day_events = events[0]
@@ -175,13 +257,13 @@ class TestTimezoneHandling:
         # June should be PDT (-07:00)
         sunrise = day_events["sunrise"]
         assert sunrise is not None
-        assert "-07:00" in sunrise or "-08:00" in sunrise, \
+        assert _offset(sunrise) in {"-07:00", "-08:00"}, \
             f"LA sunrise should have Pacific timezone offset, got: {sunrise}"
 
     def test_sun_events_use_local_timezone_rome(self, service):
         """Sun events should return times in local timezone (CET for Rome)."""
-        lat, lon = 41.9, 12.5  # Rome, Italy
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)
+        lat, lon = ROME
+        date = SOLSTICE_2023
 
         events = service.get_sun_events(lat, lon, date)
         day_events = events[0]
@@ -190,13 +272,13 @@ class TestTimezoneHandling:
         # June should be CEST (+02:00)
         sunrise = day_events["sunrise"]
         assert sunrise is not None
-        assert "+01:00" in sunrise or "+02:00" in sunrise, \
+        assert _offset(sunrise) in {"+01:00", "+02:00"}, \
             f"Rome sunrise should have CET/CEST timezone offset, got: {sunrise}"
 
     def test_moon_events_use_local_timezone(self, service):
         """Moon events should return times in local timezone."""
-        lat, lon = 34.05, -118.24  # Los Angeles
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)
+        lat, lon = LA
+        date = SOLSTICE_2023
 
         events = service.get_moon_events(lat, lon, date)
         day_events = events[0]
@@ -208,13 +290,13 @@ class TestTimezoneHandling:
         # At least one should be present with local timezone
         moon_time = moonrise or moonset
         if moon_time:
-            assert "-07:00" in moon_time or "-08:00" in moon_time, \
+            assert _offset(moon_time) in {"-07:00", "-08:00"}, \
                 f"LA moon event should have Pacific timezone offset, got: {moon_time}"
 
     def test_explicit_timezone_override(self, service):
         """Explicit timezone_str should override auto-detection."""
-        lat, lon = 34.05, -118.24  # Los Angeles
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)
+        lat, lon = LA
+        date = SOLSTICE_2023
 
         # Request Tokyo timezone for LA coordinates
         events = service.get_sun_events(lat, lon, date, timezone_str="Asia/Tokyo")
@@ -222,13 +304,13 @@ class TestTimezoneHandling:
 
         sunrise = day_events["sunrise"]
         assert sunrise is not None
-        assert "+09:00" in sunrise, \
+        assert _offset(sunrise) == "+09:00", \
             f"Should use explicit Tokyo timezone (+09:00), got: {sunrise}"
 
     def test_all_astronomical_info_uses_local_timezone(self, service):
         """Combined endpoint should return local timezone for both sun and moon."""
         lat, lon = 51.5, -0.12  # London
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)
+        date = SOLSTICE_2023
 
         result = service.get_all_astronomical_info(lat, lon, date)
 
@@ -237,30 +319,25 @@ class TestTimezoneHandling:
 
         sunrise = day["sunrise"]
         assert sunrise is not None
-        assert "+00:00" in sunrise or "+01:00" in sunrise, \
+        assert _offset(sunrise) in {"+00:00", "+01:00"}, \
             f"London sunrise should have GMT/BST offset, got: {sunrise}"
 
         # Check moon event if available
         moon_time = day.get("moonrise") or day.get("moonset")
         if moon_time:
-            assert "+00:00" in moon_time or "+01:00" in moon_time, \
+            assert _offset(moon_time) in {"+00:00", "+01:00"}, \
                 f"London moon event should have GMT/BST offset, got: {moon_time}"
 
-    def test_times_not_in_utc(self, service):
+    @pytest.mark.parametrize("lat,lon,name", [
+        (*LA, "Los Angeles"),  # Pacific
+        (35.68, 139.69, "Tokyo"),  # JST +09:00
+        (-33.87, 151.21, "Sydney"),  # AEST +10:00/+11:00
+    ])
+    def test_times_not_in_utc(self, service, lat, lon, name):
         """Times should NOT be in UTC (+00:00) for non-UTC locations."""
-        # Test multiple locations that are definitely not in UTC
-        test_locations = [
-            (34.05, -118.24, "Los Angeles"),  # Pacific
-            (35.68, 139.69, "Tokyo"),  # JST +09:00
-            (-33.87, 151.21, "Sydney"),  # AEST +10:00/+11:00
-        ]
-
-        date = datetime(2023, 6, 21, tzinfo=timezone.utc)
-
-        for lat, lon, name in test_locations:
-            events = service.get_sun_events(lat, lon, date)
-            sunrise = events[0]["sunrise"]
-
-            assert sunrise is not None, f"{name} should have sunrise"
-            assert "+00:00" not in sunrise, \
-                f"{name} should NOT be in UTC, got: {sunrise}"
+        events = service.get_sun_events(lat, lon, SOLSTICE_2023)
+        sunrise = events[0]["sunrise"]
+
+        assert sunrise is not None, f"{name} should have sunrise"
+        assert _offset(sunrise) != "+00:00", \
+            f"{name} should NOT be in UTC, got: {sunrise}"
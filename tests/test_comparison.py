@@ -0,0 +1,207 @@
+"""
+Tests for the provider comparison helpers.
+"""
+
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import comparison
+from app.comparison import (
+    calculate_tidal_ranges,
+    cached_provider_fetch,
+    find_matching_tide,
+    index_tides_by_type,
+    match_tides,
+)
+
+
+class TestCalculateTidalRanges:
+    """Tests for calculate_tidal_ranges."""
+
+    def test_empty_tides_give_no_ranges(self):
+        """No tides should give no ranges, not a lone None."""
+        assert calculate_tidal_ranges([]) == []
+
+    def test_single_tide_has_no_range(self):
+        """The first tide has no previous tide to measure from."""
+        assert calculate_tidal_ranges([{'height_m': 1.2}]) == [None]
+
+    def test_ranges_are_absolute_differences(self):
+        """Each range is the absolute height change from the previous tide."""
+        tides = [{'height_m': h} for h in (1.5, -0.5, 1.0)]
+        ranges = calculate_tidal_ranges(tides)
+        assert ranges[0] is None
+        assert ranges[1:] == pytest.approx([2.0, 1.5])
+
+
+
+T0 = datetime(2024, 1, 1)
+
+
+def tide_at(hours: float, tide_type: str) -> dict:
+    """A tide of the given type, hours after T0."""
+    return {'datetime': T0 + timedelta(hours=hours), 'type': tide_type}
+
+
+def linear_scan_match(target, tides, max_time_diff_hours=6.0):
+    """Reference: the original find_matching_tide scan, returning a position."""
+    best_match, best_diff = None, float('inf')
+    for position, tide in enumerate(tides):
+        if tide['type'] != target['type']:
+            continue
+        diff_minutes = abs((tide['datetime'] - target['datetime']).total_seconds() / 60)
+        if diff_minutes < best_diff and diff_minutes <= max_time_diff_hours * 60:
+            best_diff, best_match = diff_minutes, position
+    return best_match
+
+
+# Provider tides in time order, with a duplicate timestamp at positions 2 and 3
+PROVIDER_TIDES = [
+    tide_at(0, 'high'),
+    tide_at(6, 'low'),
+    tide_at(12, 'high'),
+    tide_at(12, 'high'),
+    tide_at(18, 'low'),
+]
+
+MATCH_CASES = [
+    ('halfway goes to the earlier tide', tide_at(6, 'high'), 0),
+    ('duplicate timestamps go to the first', tide_at(12.5, 'high'), 2),
+    ('exactly at the window edge', tide_at(18, 'high'), 2),
+    ('just beyond the window', {'datetime': T0 + timedelta(hours=18, seconds=1), 'type': 'high'}, None),
+    ('before the first tide', tide_at(-2, 'high'), 0),
+    ('too far before the first tide', tide_at(-1, 'low'), None),
+    ('after the last tide', tide_at(20, 'low'), 4),
+    ('type missing from the index', tide_at(6, 'slack'), None),
+]
+
+
+class TestMatchTides:
+    """Tests for match_tides against the linear scan it replaced."""
+
+    @pytest.mark.parametrize("target,expected", [case[1:] for case in MATCH_CASES], ids=[case[0] for case in MATCH_CASES])
+    def test_match_cases(self, target, expected):
+        """Each case should match the expected tide, as the linear scan does."""
+        index = index_tides_by_type(PROVIDER_TIDES)
+        assert match_tides([target], index) == [expected]
+        assert linear_scan_match(target, PROVIDER_TIDES) == expected
+
+    def test_all_targets_at_once(self):
+        """Matching many targets together should keep target order."""
+        targets = [case[1] for case in MATCH_CASES]
+        assert match_tides(targets, index_tides_by_type(PROVIDER_TIDES)) == [case[2] for case in MATCH_CASES]
+
+    def test_empty_targets(self):
+        """No targets should give no matches."""
+        assert match_tides([], index_tides_by_type(PROVIDER_TIDES)) == []
+
+    def test_empty_index(self):
+        """Without provider tides nothing matches."""
+        assert index_tides_by_type([]) == {}
+        assert match_tides([tide_at(0, 'high')], {}) == [None]
+        assert find_matching_tide(tide_at(0, 'high'), []) is None
+
+    def test_find_matching_tide_returns_the_tide(self):
+        """find_matching_tide should return the matched provider dict itself."""
+        assert find_matching_tide(tide_at(12.5, 'high'), PROVIDER_TIDES) is PROVIDER_TIDES[2]
+
+    def test_matches_linear_scan_on_random_tides(self):
+        """Random time-ordered tides on a coarse grid (many ties) match the linear scan."""
+        rng = random.Random(0)
+        types = ('high', 'low')
+        tides = sorted(
+            (tide_at(rng.randrange(0, 96, 3), rng.choice(types)) for _ in range(60)),
+            key=lambda tide: tide['datetime'],
+        )
+        targets = [tide_at(rng.randrange(-12, 108), rng.choice(types)) for _ in range(200)]
+        for max_hours in (3.0, 6.0):
+            expected = [linear_scan_match(target, tides, max_hours) for target in targets]
+            assert match_tides(targets, index_tides_by_type(tides), max_hours) == expected
+
+
+TIDES = [
+    {'datetime': datetime(2024, 1, 1, 3, 15), 'height_m': 1.2, 'type': 'high'},
+    {'datetime': datetime(2024, 1, 1, 9, 40), 'height_m': -0.3, 'type': 'low'},
+]
+
+
+class TestCachedProviderFetch:
+    """Tests for the provider response cache."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Empty disk and memory caches on a fixed UTC date."""
+        monkeypatch.setattr(comparison, 'PROVIDER_CACHE_DIR', str(tmp_path))
+        monkeypatch.setattr(comparison, '_PROVIDER_MEMORY_CACHE', {})
+        monkeypatch.setattr(comparison, '_PROVIDER_CACHE_PRUNED_DAY', None)
+        monkeypatch.setattr(comparison, '_utc_today', lambda: '2024-01-01')
+        return tmp_path
+
+    @staticmethod
+    def counting_fetch(result):
+        """A cached fake fetch that returns result and counts its calls."""
+        calls = []
+
+        @cached_provider_fetch('FAKE')
+        def fetch(station_id, days=3):
+            calls.append((station_id, days))
+            return result
+
+        return fetch, calls
+
+    def test_second_call_is_a_hit(self, cache_dir):
+        """Repeating a call should return the cached tides without fetching."""
+        fetch, calls = self.counting_fetch(TIDES)
+        assert fetch('abc', days=2) == TIDES
+        assert fetch('abc', days=2) == TIDES
+        assert len(calls) == 1
+
+    def test_disk_cache_survives_memory_cache(self, cache_dir):
+        """With the memory cache cleared, the disk copy should still skip the fetch."""
+        fetch, calls = self.counting_fetch(TIDES)
+        fetch('abc')
+        comparison._PROVIDER_MEMORY_CACHE.clear()
+        assert fetch('abc') == TIDES
+        assert len(calls) == 1
+        assert [name for name in os.listdir(cache_dir) if name.endswith('.tmp')] == []
+
+    def test_different_arguments_miss(self, cache_dir):
+        """Each argument combination is fetched separately."""
+        fetch, calls = self.counting_fetch(TIDES)
+        fetch('abc')
+        fetch('abc', days=5)
+        fetch('xyz')
+        assert len(calls) == 3
+
+    def test_failed_fetch_is_not_cached(self, cache_dir):
+        """None means the fetch failed, so the next call should retry."""
+        fetch, calls = self.counting_fetch(None)
+        assert fetch('abc') is None
+        assert fetch('abc') is None
+        assert len(calls) == 2
+        assert os.listdir(cache_dir) == []
+
+    def test_corrupt_file_falls_back_to_fetching(self, cache_dir):
+        """An unreadable cache file should be refetched and rewritten."""
+        fetch, calls = self.counting_fetch(TIDES)
+        fetch('abc')
+        (name,) = os.listdir(cache_dir)
+        (cache_dir / name).write_text('{not json')
+        comparison._PROVIDER_MEMORY_CACHE.clear()
+        assert fetch('abc') == TIDES
+        assert len(calls) == 2
+        comparison._PROVIDER_MEMORY_CACHE.clear()
+        assert fetch('abc') == TIDES
+        assert len(calls) == 2
+
+    def test_new_utc_date_misses(self, cache_dir, monkeypatch):
+        """Results are refetched on a new UTC date and earlier days' files are pruned."""
+        fetch, calls = self.counting_fetch(TIDES)
+        fetch('abc')
+        monkeypatch.setattr(comparison, '_utc_today', lambda: '2024-01-02')
+        assert fetch('abc') == TIDES
+        assert len(calls) == 2
+        assert [name[:10] for name in os.listdir(cache_dir)] == ['2024-01-02']
@@ -2,15 +2,19 @@
 Unit tests for FES2022 Tide Service
 """
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
+
+import numpy as np
+
 from app.tide_service import FES2022TideService, TidalDatum
 
 
 @pytest.fixture
-def service():
-    """Create a tide service instance for testing."""
-    return FES2022TideService(data_path='./')
+def service(tide_service):
+    """Tide service instance for testing (shared across the session, see conftest.py)."""
+    return tide_service
 
 
 class TestTideServiceInitialization:
@@ -71,18 +75,25 @@ class TestLongitudeConversion:
         # The service should handle this internally
         assert amp1 > 0
 
+    def test_interpolation_continuous_across_seam(self, service):
+        """Points either side of the grid's longitude seam should get similar values."""
+        amp1, _ = service.get_constituent_data('m2', -20.0, 179.99)
+        amp2, _ = service.get_constituent_data('m2', -20.0, -179.99)
+        assert amp1 > 0 and amp2 > 0
+        assert abs(amp1 - amp2) < 0.01
+
 
 class TestTidePrediction:
     """Tests for tide prediction functionality."""
 
-    def test_predict_tides_returns_events(self, service):
+    def test_predict_tides_returns_events(self, predicted_tides):
         """Should return tide events for valid location."""
-        tides = service.predict_tides(lat=34.03, lon=-118.68, days=1)
+        tides = predicted_tides(34.03, -118.68, days=1)
         assert len(tides) > 0, "Should return at least one tide event"
 
-    def test_tide_event_structure(self, service):
+    def test_tide_event_structure(self, predicted_tides):
         """Tide events should have correct structure."""
-        tides = service.predict_tides(lat=34.03, lon=-118.68, days=1)
+        tides = predicted_tides(34.03, -118.68, days=1)
         for tide in tides:
             assert 'type' in tide
             assert 'datetime' in tide
@@ -100,15 +111,15 @@ class TestTidePrediction:
         assert min_expected <= len(tides) <= max_expected, \
             f"Expected {min_expected}-{max_expected} tides, got {len(tides)}"
 
-    def test_tides_are_sorted_by_time(self, service):
+    def test_tides_are_sorted_by_time(self, predicted_tides):
         """Tide events should be sorted chronologically."""
-        tides = service.predict_tides(lat=34.03, lon=-118.68, days=3)
+        tides = predicted_tides(34.03, -118.68, days=3)
         datetimes = [tide['datetime'] for tide in tides]
         assert datetimes == sorted(datetimes), "Tides should be sorted by time"
 
-    def test_alternating_high_low(self, service):
+    def test_alternating_high_low(self, predicted_tides):
         """Tides should generally alternate between high and low."""
-        tides = service.predict_tides(lat=34.03, lon=-118.68, days=3)
+        tides = predicted_tides(34.03, -118.68, days=3)
         # Count transitions
         alternations = 0
         for i in range(1, len(tides)):
@@ -118,16 +129,16 @@ class TestTidePrediction:
         assert alternations >= len(tides) * 0.7, \
             "Most tides should alternate between high and low"
 
-    def test_realistic_tide_heights(self, service):
+    def test_realistic_tide_heights(self, predicted_tides):
         """Tide heights should be realistic (typically -3m to +3m)."""
-        tides = service.predict_tides(lat=34.03, lon=-118.68, days=7)
+        tides = predicted_tides(34.03, -118.68, days=7)
         for tide in tides:
             assert -5 < tide['height_m'] < 5, \
                 f"Tide height {tide['height_m']}m seems unrealistic"
 
-    def test_height_feet_conversion(self, service):
+    def test_height_feet_conversion(self, predicted_tides):
         """Feet conversion should be accurate."""
-        tides = service.predict_tides(lat=34.03, lon=-118.68, days=1)
+        tides = predicted_tides(34.03, -118.68, days=1)
         for tide in tides:
             expected_ft = tide['height_m'] * 3.28084
             assert abs(tide['height_ft'] - expected_ft) < 0.01, \
@@ -148,16 +159,16 @@ class TestDatetimeFormat:
         r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}$'
     )
 
-    def test_datetime_is_iso8601_format(self, service):
+    def test_datetime_is_iso8601_format(self, predicted_tides):
         """Datetime should be in ISO 8601 format with timezone."""
-        tides = service.predict_tides(lat=34.03, lon=-118.68, days=1)
+        tides = predicted_tides(34.03, -118.68, days=1)
         for tide in tides:
             assert self.ISO_PATTERN.match(tide['datetime']), \
                 f"Datetime '{tide['datetime']}' is not in ISO 8601 format"
 
-    def test_datetime_has_no_microseconds(self, service):
+    def test_datetime_has_no_microseconds(self, predicted_tides):
         """Datetime should not include microseconds."""
-        tides = service.predict_tides(lat=34.03, lon=-118.68, days=1)
+        tides = predicted_tides(34.03, -118.68, days=1)
         for tide in tides:
             assert '.' not in tide['datetime'], \
                 "Datetime should not contain microseconds"
@@ -226,6 +237,53 @@ class TestMultipleLocations:
             assert -10 < tide['height_m'] < 10, \
                 f"{name}: tide height {tide['height_m']}m seems unrealistic"
 
+    def test_batch_matches_single_predictions(self, service):
+        """Batch prediction should give the same events as per-location calls."""
+        coords = [(lat, lon) for _, lat, lon in self.LOCATIONS[:3]]
+        batch = service.predict_tides_batch(coords, days=2)
+        assert len(batch) == len(coords)
+        for (lat, lon), tides in zip(coords, batch):
+            assert tides == service.predict_tides(lat=lat, lon=lon, days=2)
+
+    def test_concurrent_predictions_match_sequential(self, service):
+        """Predictions from several threads at once should not clobber each other's synthesis scratch."""
+        coords = [(lat, lon) for _, lat, lon in self.LOCATIONS[:4]]
+        expected = [service.predict_tides(lat=lat, lon=lon, days=2) for lat, lon in coords]
+        with ThreadPoolExecutor(max_workers=len(coords)) as pool:
+            results = list(pool.map(lambda c: service.predict_tides(lat=c[0], lon=c[1], days=2), coords))
+        assert results == expected
+
+
+class TestHarmonicPrecision:
+    """Tests for the float32 harmonic synthesis."""
+
+    def test_float32_synthesis_matches_float64(self, service):
+        """Float32 synthesis should stay within 0.1 mm of a float64 evaluation over 30 days."""
+        start = np.datetime64('2024-01-01T00:00:00', 'us')
+        times = start + np.arange(30 * 24 * 20) * np.timedelta64(3, 'm')
+        constituents = service._load_constituents(34.03, -118.68)
+        time_factors = service._time_factors(times)
+
+        heights = service._calculate_harmonic_tide_at_times(times, constituents, time_factors=time_factors)
+
+        nodal = time_factors['nodal']
+        f = np.array([nodal.get(name, (1.0, 0.0))[0] for name in constituents['names']])
+        u = np.array([nodal.get(name, (1.0, 0.0))[1] for name in constituents['names']])
+        V = time_factors['astro_args'] @ constituents['doodson'].T
+        phase = np.radians(V + u - constituents['kappas'].astype(np.float64))
+        expected = np.cos(phase) @ (f * constituents['amplitudes'].astype(np.float64))
+
+        assert np.max(np.abs(heights - expected)) < 1e-4
+
+    def test_synthesis_results_are_not_reused(self, service):
+        """Heights from one call should survive later calls, which reuse the kernel's scratch arrays."""
+        start = np.datetime64('2024-01-01T00:00:00', 'us')
+        times = start + np.arange(24 * 20) * np.timedelta64(3, 'm')
+        first = service._calculate_harmonic_tide_at_times(times, service._load_constituents(34.03, -118.68))
+        saved = first.copy()
+        service._calculate_harmonic_tide_at_times(times, service._load_constituents(21.66, -158.05))
+        np.testing.assert_array_equal(first, saved)
+
 
 class TestTideHeightsInterval:
     """Tests for get_tide_heights interval data."""
@@ -347,6 +405,14 @@ class TestTidalDatum:
             assert t1['datetime'] == t2['datetime']
             assert abs(t1['height_m'] - t2['height_m']) < 0.001
 
+    def test_datum_offset_is_cached(self, service):
+        """Datum offsets should be computed once per rounded location and reused."""
+        offset1 = service._calculate_datum_offset(34.03, -118.68, TidalDatum.MLLW, days=30)
+        offset2 = service._calculate_datum_offset(34.0301, -118.6801, TidalDatum.MLLW, days=30)
+        assert offset1 == offset2
+        uncached = service._compute_datum_offset(34.03, -118.68, TidalDatum.MLLW, 30)
+        assert abs(offset1 - uncached) < 1e-9
+
     def test_all_datums_preserve_tidal_range(self, service):
         """Tidal range (difference between high and low) should be same regardless of datum."""
         msl_tides = service.predict_tides(lat=34.03, lon=-118.68, days=3, datum=TidalDatum.MSL)